@@ -1,4 +1,5 @@
 @echo off
 setlocal
 python -m pip install -r requirements.txt
+python scripts\generate_i18n.py
 pyinstaller --noconfirm --clean iImport.spec
\ No newline at end of file
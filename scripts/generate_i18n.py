@@ -0,0 +1,54 @@
+"""
+Generate src/ui/i18n_data.py from the JSON translation files.
+
+The JSON files in src/ui/i18n stay the editable source; run this after changing them:
+    python scripts/generate_i18n.py
+With --check it only verifies that the generated module is up to date (exit code 1 if not).
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+I18N_DIR = ROOT / 'src' / 'ui' / 'i18n'
+OUTPUT = ROOT / 'src' / 'ui' / 'i18n_data.py'
+LANGUAGES = ('en', 'es', 'ca')
+
+
+def load_translations() -> dict[str, dict[str, str]]:
+    return {
+        code: json.loads((I18N_DIR / f'{code}.json').read_text(encoding='utf-8-sig'))
+        for code in LANGUAGES
+    }
+
+
+def render(translations: dict[str, dict[str, str]]) -> str:
+    lines = [
+        '# Generated by scripts/generate_i18n.py from src/ui/i18n/*.json. Do not edit.',
+        'TRANSLATIONS = {',
+    ]
+    for code, data in translations.items():
+        lines.append(f'    {code!r}: {{')
+        for key, value in data.items():
+            lines.append(f'        {key!r}: {value!r},')
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv: list[str]) -> int:
+    source = render(load_translations())
+    if '--check' in argv:
+        current = OUTPUT.read_text(encoding='utf-8') if OUTPUT.exists() else ''
+        if current != source:
+            print(f'{OUTPUT} is out of date; run scripts/generate_i18n.py')
+            return 1
+        return 0
+    OUTPUT.write_text(source, encoding='utf-8')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(sys.argv[1:]))
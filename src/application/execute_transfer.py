@@ -10,11 +10,21 @@ from domain.rules import ensure_unique_path
 from infrastructure.fs.atomic_write import atomic_move
 from infrastructure.fs.logger import create_logger
 from infrastructure.fs.path_utils import get_app_root
-from infrastructure.wpd.com_wrapper import open_device_session
+from infrastructure.wpd.com_wrapper import (
+    download_file,
+    download_files_shell_batch,
+    is_shell_object_id,
+    open_device_session,
+)
 from application.convert_media import conversion_available, convert_media
 from application.core_messages import tr
 
 
+# Shell items are copied this many per file operation. Bounds how long the moves,
+# conversions and log lines of a batch wait behind its copies.
+SHELL_BATCH_SIZE = 200
+
+
 def _temp_path_for(dest_rel: str, temp_dir: Path, object_id: str) -> Path:
     seed = f'{object_id}|{dest_rel}'.encode('utf-8', errors='ignore')
     digest = hashlib.sha1(seed).hexdigest()
@@ -59,6 +69,111 @@ def execute_transfer(
     if options.create_compat and not can_convert:
         log_line(tr(language, 'error_tools_missing'))
 
+    def same_size(dest_path: Path, item) -> bool:
+        # Only skip if we have a valid known size (> 0) to compare
+        try:
+            return item.size > 0 and dest_path.stat().st_size == item.size
+        except Exception:
+            return False
+
+    def report_skip(index: int, item) -> None:
+        if progress_cb:
+            progress_cb(
+                TransferProgress(
+                    current_index=index,
+                    total_files=total_files,
+                    current_file=item.name,
+                    current_bytes=item.size,
+                    current_total=item.size,
+                    bytes_done=bytes_done,
+                    bytes_total=bytes_total,
+                )
+            )
+
+    def finish_download(item, temp_path: Path, dest_path: Path) -> None:
+        nonlocal copied, bytes_done, converted
+        atomic_move(temp_path, dest_path)
+        copied += 1
+        bytes_done += item.size
+        log_line(f'OK: {dest_path}')
+
+        # A cancelled run still keeps what it copied, but stops starting conversions
+        if can_convert and not (cancel_token and cancel_token.cancelled):
+            ok_conv, compat_path = convert_media(
+                item,
+                dest_path,
+                dest_path,
+                get_app_root(),
+                log_line,
+                log_debug,
+            )
+            if ok_conv and compat_path:
+                converted += 1
+                log_line(f'COMPAT OK: {compat_path}')
+            elif item.extension.lower() in ('.heic', '.heif', '.mov', '.m4v'):
+                log_line(tr(language, 'error_conversion_failed').format(name=dest_path.name))
+
+    # (index, item, planned dest_path, temp_path) of shell items waiting for the next batch copy
+    shell_batch: list = []
+
+    def run_shell_batch() -> None:
+        """Copy the queued shell items in one file operation, then finish them in plan order."""
+        nonlocal skipped, failed, bytes_done
+        batch = shell_batch[:]
+        shell_batch.clear()
+        batch_bytes = 0
+
+        def on_copied(k: int) -> None:
+            nonlocal batch_bytes
+            index, item, _dest_path, _temp_path = batch[k]
+            batch_bytes += item.size
+            if progress_cb:
+                progress_cb(
+                    TransferProgress(
+                        current_index=index,
+                        total_files=total_files,
+                        current_file=item.name,
+                        current_bytes=item.size,
+                        current_total=item.size,
+                        bytes_done=bytes_done + batch_bytes,
+                        bytes_total=bytes_total,
+                    )
+                )
+
+        results = download_files_shell_batch(
+            [(item.object_id, temp_path) for _, item, _, temp_path in batch],
+            cancel_token,
+            on_copied,
+        )
+        # Copies that landed before a cancel are still moved into place and counted
+        for (index, item, dest_path, temp_path), ok in zip(batch, results):
+            if not ok:
+                temp_path.unlink(missing_ok=True)
+                if cancel_token and cancel_token.cancelled:
+                    # Not copied because the run was cancelled, not because it failed
+                    continue
+                failed += 1
+                errors.append(f'Error copiando {item.name}')
+                log_line(f'ERROR: {item.name}')
+                continue
+            try:
+                # Earlier items of this batch may have landed on the same name since it was queued
+                if dest_path.exists():
+                    if same_size(dest_path, item):
+                        temp_path.unlink(missing_ok=True)
+                        skipped += 1
+                        bytes_done += item.size
+                        log_line(f'SKIP (same size): {dest_path.name}')
+                        report_skip(index, item)
+                        continue
+                    dest_path = ensure_unique_path(dest_path)
+                finish_download(item, temp_path, dest_path)
+            except Exception as exc:
+                failed += 1
+                errors.append(f'Error copiando {item.name}: {exc}')
+                log_line(f'ERROR: {item.name} ({exc})')
+                temp_path.unlink(missing_ok=True)
+
     device_disconnected = False
     last_index = 0
     try:
@@ -66,7 +181,6 @@ def execute_transfer(
             for index, plan_item in enumerate(plan.items, start=1):
                 last_index = index
                 if cancel_token and cancel_token.cancelled:
-                    log_line(tr(language, 'error_import_cancelled'))
                     break
 
                 item = plan_item.item
@@ -74,29 +188,28 @@ def execute_transfer(
                 temp_path = _temp_path_for(plan_item.dest_rel_path, tmp_dir, item.object_id)
 
                 if dest_path.exists():
-                    try:
-                        # Only skip if we have a valid known size (> 0) to compare
-                        if item.size > 0 and dest_path.stat().st_size == item.size:
-                            skipped += 1
-                            bytes_done += item.size
-                            log_line(f'SKIP (same size): {dest_path.name}')
-                            if progress_cb:
-                                progress_cb(
-                                    TransferProgress(
-                                        current_index=index,
-                                        total_files=total_files,
-                                        current_file=item.name,
-                                        current_bytes=item.size,
-                                        current_total=item.size,
-                                        bytes_done=bytes_done,
-                                        bytes_total=bytes_total,
-                                    )
-                                )
-                            continue
-                    except Exception:
-                        pass
+                    if same_size(dest_path, item):
+                        skipped += 1
+                        bytes_done += item.size
+                        log_line(f'SKIP (same size): {dest_path.name}')
+                        report_skip(index, item)
+                        continue
                     dest_path = ensure_unique_path(dest_path)
 
+                # Shell items are queued and copied together, one file operation per batch.
+                # Where each lands is decided when the batch is finished, as it would be
+                # one by one, so they queue with their planned path.
+                if is_shell_object_id(item.object_id):
+                    shell_batch.append((index, item, plan_item.dest_abs_path, temp_path))
+                    if len(shell_batch) >= SHELL_BATCH_SIZE:
+                        run_shell_batch()
+                    continue
+                # Keep plan order when a non-shell item follows queued shell items
+                if shell_batch:
+                    run_shell_batch()
+                    if cancel_token and cancel_token.cancelled:
+                        break
+
                 current_bytes = 0
 
                 def on_chunk(bytes_written: int) -> None:
@@ -116,7 +229,7 @@ def execute_transfer(
                         )
 
                 try:
-                    ok = session.download(item.object_id, temp_path, on_chunk, cancel_token)
+                    ok = download_file(device.id, item.object_id, temp_path, on_chunk, cancel_token, session=session)
                     if cancel_token and cancel_token.cancelled:
                         if temp_path.exists():
                             temp_path.unlink(missing_ok=True)
@@ -129,25 +242,7 @@ def execute_transfer(
                             temp_path.unlink(missing_ok=True)
                         bytes_done += current_bytes
                         continue
-                    atomic_move(temp_path, dest_path)
-                    copied += 1
-                    bytes_done += item.size
-                    log_line(f'OK: {dest_path}')
-
-                    if can_convert:
-                        ok_conv, compat_path = convert_media(
-                            item,
-                            dest_path,
-                            dest_path,
-                            get_app_root(),
-                            log_line,
-                            log_debug,
-                        )
-                        if ok_conv and compat_path:
-                            converted += 1
-                            log_line(f'COMPAT OK: {compat_path}')
-                        elif item.extension.lower() in ('.heic', '.heif', '.mov', '.m4v'):
-                            log_line(tr(language, 'error_conversion_failed').format(name=dest_path.name))
+                    finish_download(item, temp_path, dest_path)
                 except COMError:
                     device_disconnected = True
                     failed += 1
@@ -163,6 +258,10 @@ def execute_transfer(
                     if temp_path.exists():
                         temp_path.unlink(missing_ok=True)
                     bytes_done += current_bytes
+            else:
+                # The plan ran to its end: copy what is still queued
+                if shell_batch:
+                    run_shell_batch()
     except COMError:
         device_disconnected = True
         errors.append(tr(language, 'error_device_disconnected'))
@@ -175,6 +274,8 @@ def execute_transfer(
 
     cancelled = bool(cancel_token and cancel_token.cancelled)
     if cancelled:
+        # Logged once here: a cancel can end the run from the loop or from any batch flush
+        log_line(tr(language, 'error_import_cancelled'))
         for part in tmp_dir.glob('*.part'):
             try:
                 part.unlink()
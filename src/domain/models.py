@@ -35,7 +35,7 @@ class DeviceInfo:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     device_id: str
     object_id: str
@@ -101,7 +101,7 @@ class ImportPlan:
     total_size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferProgress:
     current_index: int
     total_files: int
@@ -1,9 +1,16 @@
 ﻿from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional, faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
 DEFAULT_CONFIG = {
     'language': 'en',
     'structure_preset': 'A',
@@ -13,6 +20,19 @@ DEFAULT_CONFIG = {
     'create_compat': False,
 }
 
+# Saves may run on a worker thread; serialize them so the temp file is not shared
+_save_lock = threading.Lock()
+
+
+def fast_dumps(data: dict[str, Any]) -> bytes:
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def fast_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 
 def config_path(app_root: Path) -> Path:
     return app_root / 'config.json'
@@ -23,7 +43,7 @@ def load_config(app_root: Path) -> dict[str, Any]:
     if not path.exists():
         return DEFAULT_CONFIG.copy()
     try:
-        data = json.loads(path.read_text(encoding='utf-8'))
+        data = fast_loads(path.read_bytes())
     except Exception:
         return DEFAULT_CONFIG.copy()
     cfg = DEFAULT_CONFIG.copy()
@@ -35,4 +55,8 @@ def save_config(app_root: Path, data: dict[str, Any]) -> None:
     path = config_path(app_root)
     payload = DEFAULT_CONFIG.copy()
     payload.update({k: v for k, v in data.items() if k in payload})
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
\ No newline at end of file
+    raw = fast_dumps(payload)
+    tmp = path.with_name(path.name + '.tmp')
+    with _save_lock:
+        tmp.write_bytes(raw)
+        os.replace(tmp, path)
@@ -0,0 +1,43 @@
+﻿from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+
+import comtypes
+
+# COM apartment nesting depth and apartment-bound object cache, per thread;
+# shared by the WPD and shell wrappers
+_com_state = threading.local()
+
+
+@contextmanager
+def com_apartment():
+    """
+    Initialize COM (STA) for the current thread once.
+    Nested uses on the same thread, from either wrapper, reuse the outer apartment.
+    """
+    depth = getattr(_com_state, 'depth', 0)
+    if depth == 0:
+        comtypes.CoInitialize()
+    _com_state.depth = depth + 1
+    try:
+        yield
+    finally:
+        _com_state.depth = depth
+        if depth == 0:
+            # Cached objects belong to the apartment and must not outlive it
+            _com_state.cache = None
+            comtypes.CoUninitialize()
+
+
+def apartment_cache() -> dict:
+    """
+    Per-thread store for COM objects bound to the current apartment.
+    Emptied when the thread's outermost com_apartment() ends; outside one, a throwaway dict.
+    """
+    if not getattr(_com_state, 'depth', 0):
+        return {}
+    cache = getattr(_com_state, 'cache', None)
+    if cache is None:
+        cache = _com_state.cache = {}
+    return cache
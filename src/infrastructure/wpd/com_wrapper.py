@@ -1,6 +1,8 @@
 ﻿from __future__ import annotations
 
 import ctypes
+import functools
+import os
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -14,10 +16,14 @@ from comtypes import COMError, GUID
 from domain import CancelToken, DeviceInfo, MediaItem, PHOTO_EXTS, VIDEO_EXTS
 from domain.errors import ScanCancelled, ScanError
 from infrastructure.fs.path_utils import ensure_cache_dir
+from infrastructure.wpd.com import com_apartment
 
 WPD_DEVICE_OBJECT_ID = 'DEVICE'
 STGM_READ = 0x00000000
 
+# Unbuffered binary writes for downloads (O_BINARY only exists on Windows)
+_DOWNLOAD_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
 # Content type GUIDs for containers
 WPD_CONTENT_TYPE_FOLDER = GUID("{27E2E392-A111-48E0-AB0C-E17705A05F85}")
 # Functional objects are used for storage roots on some devices (e.g., iPhone)
@@ -30,6 +36,9 @@ WPD_CONTENT_TYPE_VIDEO = GUID("{9261B03C-3D78-4519-85E3-02C5E1F50BB9}")
 WPD_CONTENT_TYPE_AUDIO = GUID("{4AD2C85E-5E2D-45E5-8864-4F229E3C6CF0}")
 MEDIA_CONTENT_TYPES = {WPD_CONTENT_TYPE_IMAGE, WPD_CONTENT_TYPE_VIDEO}
 
+# Single lookup set for the per-object media filter
+_MEDIA_EXTS = frozenset(PHOTO_EXTS) | frozenset(VIDEO_EXTS)
+
 # Internal storage name patterns (multilingual)
 INTERNAL_STORAGE_PATTERNS = (
     'internal storage',
@@ -40,7 +49,6 @@ INTERNAL_STORAGE_PATTERNS = (
 # Cache for WPD property keys
 _wpd_keys_cache = {}
 
-
 def _make_property_key(Types, fmtid_str: str, pid: int):
     """Create a PROPERTYKEY using the Types module's _tagpropertykey."""
     pk = Types._tagpropertykey()
@@ -75,14 +83,15 @@ def _setup_comtypes_cache() -> None:
     cache_dir = ensure_cache_dir() / 'comtypes_gen'
     cache_dir.mkdir(parents=True, exist_ok=True)
     try:
-        import os
         os.environ['COMTYPES_GEN_PATH'] = str(cache_dir)
     except Exception:
         pass
     comtypes.client.gen_dir = str(cache_dir)
 
 
+@functools.lru_cache(maxsize=1)
 def _ensure_wpd_module():
+    """Generate/load the WPD type libraries once per process."""
     _setup_comtypes_cache()
     comtypes.client.GetModule('portabledeviceapi.dll')
     comtypes.client.GetModule('portabledevicetypes.dll')
@@ -97,15 +106,6 @@ def _get_wpd_api():
     return api
 
 
-@contextmanager
-def com_context():
-    comtypes.CoInitialize()
-    try:
-        yield
-    finally:
-        comtypes.CoUninitialize()
-
-
 def _get_device_string(mgr, device_id: str, method_name: str) -> str:
     method = getattr(mgr, method_name)
     length = ctypes.c_ulong(0)
@@ -141,7 +141,7 @@ def _get_device_string_direct(mgr, device_id: str, method_name: str) -> str:
 def list_devices() -> list[DeviceInfo]:
     """List all WPD devices using direct COM calls."""
     devices: list[DeviceInfo] = []
-    with com_context():
+    with com_apartment():
         API, Types = _ensure_wpd_module()
         mgr = comtypes.client.CreateObject(API.PortableDeviceManager)
         
@@ -239,11 +239,15 @@ def _enum_object_ids(enum) -> Iterator[str]:
             break
 
 
-def _get_values(props, object_id: str, keys: Iterable, Types) -> object:
+def _make_key_collection(keys: Iterable, Types):
     key_collection = comtypes.client.CreateObject(Types.PortableDeviceKeyCollection)
     for key in keys:
         key_collection.Add(key)
-    return props.GetValues(object_id, key_collection)
+    return key_collection
+
+
+def _get_values(props, object_id: str, keys: Iterable, Types) -> object:
+    return props.GetValues(object_id, _make_key_collection(keys, Types))
 
 
 def _get_all_values(props, object_id: str):
@@ -251,11 +255,12 @@ def _get_all_values(props, object_id: str):
     return props.GetValues(object_id, None)
 
 
-def _extract_object_info_from_all(values, keys_dict, Types) -> dict:
+def _extract_object_info_from_all(values, keys_dict, Types, include_dates: bool = True) -> dict:
     """
     Extract object info from all available properties.
     Returns dict with 'name', 'size', 'content_type', 'created', 'modified'.
     Tries multiple property keys to find the filename.
+    Dates are left as None when include_dates is False.
     """
     info = {'name': '', 'original_name': '', 'size': 0, 'content_type': None, 'created': None, 'modified': None}
     
@@ -270,8 +275,9 @@ def _extract_object_info_from_all(values, keys_dict, Types) -> dict:
     info['original_name'] = _safe_get_string(values, keys_dict['OBJECT_ORIGINAL_FILE_NAME'])
     info['size'] = _safe_get_unsigned(values, keys_dict['OBJECT_SIZE'])
     info['content_type'] = _safe_get_guid(values, keys_dict['OBJECT_CONTENT_TYPE'])
-    info['created'] = _safe_get_date(values, keys_dict['OBJECT_DATE_CREATED'])
-    info['modified'] = _safe_get_date(values, keys_dict['OBJECT_DATE_MODIFIED'])
+    if include_dates:
+        info['created'] = _safe_get_date(values, keys_dict['OBJECT_DATE_CREATED'])
+        info['modified'] = _safe_get_date(values, keys_dict['OBJECT_DATE_MODIFIED'])
     
     # If no name found, try to iterate all properties to find ANY string that looks like a filename
     if not info['name'] and not info['original_name']:
@@ -335,23 +341,33 @@ def _safe_get_date(values, key) -> datetime | None:
     return _coerce_datetime(value)
 
 
+_FILETIME_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
+
+
 def _coerce_datetime(value) -> datetime | None:
     if value is None:
         return None
-    if isinstance(value, datetime):
+    tp = type(value)
+    # Common cases first: FILETIME ticks and already-converted VT_DATE values
+    if tp is int or tp is float:
+        try:
+            return _FILETIME_EPOCH + timedelta(microseconds=int(value) // 10)
+        except (OverflowError, ValueError):
+            return None
+    if tp is datetime:
         return value
-    if isinstance(value, str):
+    if tp is str:
         try:
             return datetime.fromisoformat(value)
-        except Exception:
+        except ValueError:
             return None
+    if isinstance(value, datetime):
+        return value
     if isinstance(value, (int, float)):
-        try:
-            return datetime(1601, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=int(value) / 10)
-        except Exception:
-            return None
-    if hasattr(value, 'value') and isinstance(value.value, datetime):
-        return value.value
+        return _coerce_datetime(int(value))
+    inner = getattr(value, 'value', None)
+    if isinstance(inner, datetime):
+        return inner
     return None
 
 
@@ -570,7 +586,7 @@ def _list_media_items_wpd(
     log, log_path = _make_scan_logger()
     items: list[MediaItem] = []
     log(f'Start WPD scan device_id={device_id}')
-    with com_context():
+    with com_apartment():
         device, API, Types = _open_device(device_id)
         keys_dict = _get_wpd_keys(Types)
         try:
@@ -613,6 +629,20 @@ def _list_media_items_wpd(
             # Track first few objects for deep debugging
             debug_first_objects = 0
 
+            # One GetValues per object with what is needed to classify it. Dates are only
+            # needed for media, so they ride along only while siblings keep being media
+            # (photo folders) and are fetched separately for the first media hit otherwise.
+            base_keys = [
+                keys_dict['OBJECT_NAME'],
+                keys_dict['OBJECT_ORIGINAL_FILE_NAME'],
+                keys_dict['OBJECT_SIZE'],
+                keys_dict['OBJECT_CONTENT_TYPE'],
+            ]
+            date_key_list = [keys_dict['OBJECT_DATE_CREATED'], keys_dict['OBJECT_DATE_MODIFIED']]
+            classify_keys = _make_key_collection(base_keys, Types)
+            date_keys = _make_key_collection(date_key_list, Types)
+            media_keys = _make_key_collection(base_keys + date_key_list, Types)
+
             def scan_recursive(parent_id: str, current_path: str, depth: int = 0) -> None:
                 nonlocal objects_seen, containers_seen, added_debug, skipped_no_ext, skipped_not_media, debug_first_objects
                 _check_cancel(cancel_token)
@@ -628,20 +658,29 @@ def _list_media_items_wpd(
                     progress_cb(containers_seen, 0, current_path or '/')
                 
                 enum = content.EnumObjects(0, parent_id, None)
+                expect_media = False
                 for child_id in _enum_object_ids(enum):
                     _check_cancel(cancel_token)
+                    with_dates = expect_media
+                    expect_media = False
                     
-                    # Get ALL properties for this object (more reliable for iPhone)
                     try:
-                        values = _get_all_values(props, child_id)
+                        values = props.GetValues(child_id, media_keys if with_dates else classify_keys)
                     except Exception as exc:
                         log(f'GetValues failed for {child_id}: {exc}')
                         continue
                     
                     objects_seen += 1
                     
-                    # Extract info trying multiple strategies
-                    info = _extract_object_info_from_all(values, keys_dict, Types)
+                    info = _extract_object_info_from_all(values, keys_dict, Types, include_dates=False)
+                    if not info['name'] and not info['original_name']:
+                        # Some iPhones only expose the name under other keys: get ALL properties
+                        try:
+                            values = _get_all_values(props, child_id)
+                            with_dates = True
+                            info = _extract_object_info_from_all(values, keys_dict, Types, include_dates=False)
+                        except Exception as exc:
+                            log(f'GetValues (all) failed for {child_id}: {exc}')
                     real_name = info['original_name'] if info['original_name'] else info['name']
                     content_type = info['content_type']
                     
@@ -669,22 +708,33 @@ def _list_media_items_wpd(
                         except Exception as e:
                             log(f'DEBUG error: {e}')
                     
-                    extension = Path(real_name).suffix.lower() if real_name else ''
+                    dot = real_name.rfind('.') if real_name else -1
+                    extension = real_name[dot:].lower() if dot > 0 else ''
+                    
+                    # Check if it's a media file by extension (a leaf, no need to classify further)
+                    is_media_ext = extension in _MEDIA_EXTS
                     
-                    # Check if it's a container first (recurse)
-                    if _is_container_object(content_type, real_name, extension):
+                    # Otherwise check if it's a container (recurse)
+                    if not is_media_ext and _is_container_object(content_type, real_name, extension):
                         scan_recursive(child_id, _join_path(current_path, real_name), depth + 1)
                         continue
                     
-                    # Check if it's a media file by extension
-                    is_media_ext = extension in PHOTO_EXTS or extension in VIDEO_EXTS
-                    
                     # Fallback: check content_type if no extension match
                     is_media_content = content_type in MEDIA_CONTENT_TYPES if content_type else False
                     
                     if is_media_ext or is_media_content:
                         size = info['size']
-                        created = info['created'] or info['modified']
+                        expect_media = True
+                        date_values = values
+                        if not with_dates:
+                            try:
+                                date_values = props.GetValues(child_id, date_keys)
+                            except Exception as exc:
+                                log(f'GetValues (dates) failed for {child_id}: {exc}')
+                        created = (
+                            _safe_get_date(date_values, keys_dict['OBJECT_DATE_CREATED'])
+                            or _safe_get_date(date_values, keys_dict['OBJECT_DATE_MODIFIED'])
+                        )
                         
                         # Use extension from content_type if missing
                         final_ext = extension
@@ -726,7 +776,7 @@ def _list_media_items_wpd(
             # Start the single-pass scan
             log('Starting single-pass scan...')
             scan_recursive(root_id, initial_path, 0)
-            
+
             log(
                 f'Finished scan. found_media={len(items)} objects_seen={objects_seen} '
                 f'containers_seen={containers_seen} skipped_no_ext={skipped_no_ext} skipped_not_media={skipped_not_media}'
@@ -753,19 +803,40 @@ def _list_media_items_wpd(
     return items
 
 
+def is_shell_object_id(object_id: str) -> bool:
+    """Shell ids from the shell scan: parsing names start with ::{ (CLSID format), PIDLs with pidl:."""
+    return object_id.startswith(('::{', 'pidl:'))
+
+
+def download_files_shell_batch(
+    pairs: list[tuple[str, Path]],
+    cancel_token,
+    copied_cb=None,
+) -> list[bool]:
+    """
+    Download several shell items (see is_shell_object_id) with one shell file operation.
+    Returns one success flag per (object_id, dest_path) pair, in order; copied_cb(index)
+    is called as each copy lands.
+    """
+    from infrastructure.wpd.shell_wrapper import download_files_shell
+    return download_files_shell(pairs, cancel_token, copied_cb)
+
+
 def download_file(
     device_id: str,
     object_id: str,
     dest_path: Path,
     progress_cb,
     cancel_token,
+    session: DeviceSession | None = None,
 ) -> bool:
     """
     Download a file from device.
     Tries Shell API first if object_id looks like a shell parsing name.
+    Pass an open session (see open_device_session) when downloading many files
+    to avoid opening and closing the device for each one; COM errors then propagate.
     """
-    # Shell parsing names start with ::{ (CLSID format) or pidl:
-    if object_id.startswith('::{') or object_id.startswith('pidl:'):
+    if is_shell_object_id(object_id):
         try:
             from infrastructure.wpd.shell_wrapper import download_file_shell
             return download_file_shell(object_id, dest_path, progress_cb, cancel_token)
@@ -773,6 +844,8 @@ def download_file(
             pass  # Fall through to WPD
     
     # WPD download
+    if session is not None:
+        return session.download(object_id, dest_path, progress_cb, cancel_token)
     try:
         with open_device_session(device_id) as session:
             return session.download(object_id, dest_path, progress_cb, cancel_token)
@@ -785,6 +858,7 @@ class DeviceSession:
         self._device = device
         self._resources = resources
         self._keys = keys_dict
+        self._resource_key = keys_dict['RESOURCE_DEFAULT']
 
     def download(
         self,
@@ -798,7 +872,7 @@ class DeviceSession:
         try:
             result = self._resources.GetStream(
                 object_id,
-                self._keys['RESOURCE_DEFAULT'],
+                self._resource_key,
                 STGM_READ,
                 ctypes.byref(optimal),
             )
@@ -813,7 +887,7 @@ class DeviceSession:
         except Exception:
             stream = self._resources.GetStream(
                 object_id,
-                self._keys['RESOURCE_DEFAULT'],
+                self._resource_key,
                 STGM_READ,
                 ctypes.byref(optimal),
             )
@@ -821,7 +895,8 @@ class DeviceSession:
         chunk_size = max(int(optimal.value) if optimal.value else 65536, 65536)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
         bytes_done = 0
-        with dest_path.open('wb') as handle:
+        fd = os.open(str(dest_path), _DOWNLOAD_OPEN_FLAGS, 0o644)
+        try:
             while True:
                 if cancel_token and cancel_token.cancelled:
                     return False
@@ -833,16 +908,21 @@ class DeviceSession:
                     data = data[0]
                 if not data:
                     break
-                handle.write(data)
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
                 bytes_done += len(data)
                 if progress_cb:
                     progress_cb(bytes_done)
+        finally:
+            os.close(fd)
         return True
 
 
 @contextmanager
 def open_device_session(device_id: str) -> Iterator[DeviceSession]:
-    with com_context():
+    with com_apartment():
         device, API, Types = _open_device(device_id)
         keys_dict = _get_wpd_keys(Types)
         try:
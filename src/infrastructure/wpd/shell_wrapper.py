@@ -5,64 +5,124 @@ Uses Windows Shell API (IShellFolder/IShellItem) which has better iPhone support
 from __future__ import annotations
 
 import base64
+import logging
 import os
+import queue
+import threading
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
 
 import pythoncom
+import pywintypes
+import winerror
+from win32com.server.exception import COMException
+from win32com.server.util import wrap
 from win32comext.shell import shell, shellcon
 from win32comext.propsys import propsys, pscon
 
 from domain import CancelToken, DeviceInfo, MediaItem, PHOTO_EXTS, VIDEO_EXTS
 from domain.errors import ScanCancelled, ScanError
 from infrastructure.fs.path_utils import ensure_cache_dir
+from infrastructure.wpd.com import apartment_cache, com_apartment
+
+logger = logging.getLogger(__name__)
+
+_MEDIA_EXTS = frozenset(PHOTO_EXTS) | frozenset(VIDEO_EXTS)
+
+# Single enumeration pass over folders and files. FASTITEMS lets the namespace skip
+# work it would only do for display (literal for older pywin32). ENABLE_ASYNC is not
+# set: it allows partial results for callers watching change notifications, and the
+# scan needs every item.
+_ENUM_FLAGS = (
+    shellcon.SHCONTF_FOLDERS
+    | shellcon.SHCONTF_NONFOLDERS
+    | getattr(shellcon, 'SHCONTF_FASTITEMS', 0x2000)
+)
+
+# Bound once; hot paths pass these per bind / item creation
+_IID_IShellFolder = shell.IID_IShellFolder
+_IID_IShellFolder2 = shell.IID_IShellFolder2
+_IID_IShellItem = shell.IID_IShellItem
+
+# Per-item errors logged before the rest are only counted
+_MAX_LOGGED_ERRORS = 10
 
 
 def _make_scan_logger():
-    """Create a simple file logger under _cache/scan_logs for troubleshooting scans."""
+    """
+    Create a simple file logger under _cache/scan_logs for troubleshooting scans.
+    The file stays open (line-buffered) until the returned close function is called.
+    """
     cache_dir = ensure_cache_dir() / 'scan_logs'
     cache_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.now().strftime('scan_%Y%m%d_%H%M%S.log')
     log_path = cache_dir / ts
+    handle = None
 
     def _log(msg: str) -> None:
+        nonlocal handle
         line = f'[{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}] {msg}'
         try:
-            with log_path.open('a', encoding='utf-8') as handle:
-                handle.write(line + '\n')
+            if handle is None:
+                handle = log_path.open('a', encoding='utf-8', buffering=1)
+            handle.write(line + '\n')
         except Exception:
             pass
 
-    return _log, log_path
+    def _close() -> None:
+        nonlocal handle
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:
+                pass
+            handle = None
 
+    return _log, log_path, _close
 
-def _pidl_to_object_id(pidl) -> str | None:
-    try:
-        stream = pythoncom.CreateStreamOnHGlobal(None, True)
-        shell.ILSaveToStream(stream, pidl)
-        stream.Seek(0, 0)
-        size = shell.ILGetSize(pidl)
-        data = stream.Read(size)
-        if isinstance(data, tuple):
-            data = data[0]
-        if not data:
-            return None
-        return f'pidl:{base64.b64encode(data).decode("ascii")}'
-    except Exception:
-        return None
+
+def _log_error(log, stats: dict, message: str) -> None:
+    """Log the first few per-item errors of a scan; later ones are only counted."""
+    stats['errors'] += 1
+    if stats['errors'] <= _MAX_LOGGED_ERRORS:
+        log(message)
+    elif stats['errors'] == _MAX_LOGGED_ERRORS + 1:
+        log(f'More than {_MAX_LOGGED_ERRORS} errors, further ones are not logged')
+
+
+def _pidl_to_bytes(pidl) -> bytes:
+    """
+    Flatten a pywin32 PIDL (a list of SHITEMID payloads) into ITEMIDLIST bytes.
+    Each item is its 2-byte little-endian cb (which counts itself) plus the payload.
+    """
+    return b''.join((len(part) + 2).to_bytes(2, 'little') + part for part in pidl)
+
+
+def _bytes_to_pidl(data: bytes) -> list[bytes]:
+    pidl = []
+    pos = 0
+    while pos + 2 <= len(data):
+        cb = int.from_bytes(data[pos:pos + 2], 'little')
+        if cb < 2:
+            break
+        pidl.append(data[pos + 2:pos + cb])
+        pos += cb
+    return pidl
+
+
+def _encode_object_id(data: bytes) -> str:
+    return f'pidl:{base64.b64encode(data).decode("ascii")}'
 
 
 def _object_id_to_shell_item(object_id: str):
     if object_id.startswith('pidl:'):
-        payload = object_id[5:]
-        data = base64.b64decode(payload)
-        stream = pythoncom.CreateStreamOnHGlobal(None, True)
-        stream.Write(data)
-        stream.Seek(0, 0)
-        pidl = shell.ILLoadFromStream(stream)
-        return shell.SHCreateItemFromIDList(pidl, shell.IID_IShellItem)
-    return shell.SHCreateItemFromParsingName(object_id, None, shell.IID_IShellItem)
+        pidl = _bytes_to_pidl(base64.b64decode(object_id[5:]))
+        return shell.SHCreateItemFromIDList(pidl, _IID_IShellItem)
+    return shell.SHCreateItemFromParsingName(object_id, None, _IID_IShellItem)
 
 
 def _coerce_datetime(value) -> datetime | None:
@@ -79,23 +139,88 @@ def _coerce_datetime(value) -> datetime | None:
             return None
 
 
+_DATE_KEYS = (pscon.PKEY_Photo_DateTaken, pscon.PKEY_Media_DateEncoded, pscon.PKEY_DateCreated)
+
+
+def _read_size_and_date(get_value) -> tuple[int, datetime | None]:
+    size = -1
+    try:
+        size_val = get_value(pscon.PKEY_Size)
+        if size_val is not None:
+            size = int(size_val)
+    except (pywintypes.com_error, TypeError, ValueError):
+        pass
+    for key in _DATE_KEYS:
+        # Missing properties are routine on MTP items; odd values only cost the date
+        try:
+            created = _coerce_datetime(get_value(key))
+        except (pywintypes.com_error, TypeError, ValueError):
+            continue
+        if created:
+            return size, created
+    return size, None
+
+
+def _get_file_details(folder2, file_pidl, folder_pidl_abs) -> tuple[int, datetime | None]:
+    """
+    Read size and capture date (language-independent property keys).
+    Uses IShellFolder2.GetDetailsEx on the parent folder when available,
+    falling back to a property store built from the absolute PIDL.
+    """
+    if folder2 is not None:
+        size, created = _read_size_and_date(lambda key: folder2.GetDetailsEx(file_pidl, key))
+        if size >= 0 or created:
+            return size, created
+    if not folder_pidl_abs:
+        return -1, None
+    try:
+        store = propsys.SHGetPropertyStoreFromIDList(list(folder_pidl_abs) + list(file_pidl))
+    except pywintypes.com_error:
+        return -1, None
+    return _read_size_and_date(lambda key: store.GetValue(key).GetValue())
+
+
 def _get_desktop_shell_folder():
-    """Get the desktop shell folder (root of shell namespace)."""
-    return shell.SHGetDesktopFolder()
+    """Get the desktop shell folder (root of shell namespace), once per COM apartment."""
+    cache = apartment_cache()
+    desktop = cache.get('shell_desktop')
+    if desktop is None:
+        desktop = cache['shell_desktop'] = shell.SHGetDesktopFolder()
+    return desktop
 
 
 def _get_child_shell_folder(parent_shell_folder, child_name: str):
     """Get a child shell folder by display name."""
+    # One call when the name is also a parsing name; enumerate the children otherwise
+    try:
+        _eaten, child_pidl, _attrs = parent_shell_folder.ParseDisplayName(None, None, child_name, 0)
+        return parent_shell_folder.BindToObject(child_pidl, None, _IID_IShellFolder)
+    except Exception:
+        pass
+    target = child_name.lower()
     for child_pidl in parent_shell_folder:
         try:
             display_name = parent_shell_folder.GetDisplayNameOf(child_pidl, shellcon.SHGDN_NORMAL)
-            if display_name.lower() == child_name.lower():
-                return parent_shell_folder.BindToObject(child_pidl, None, shell.IID_IShellFolder)
-        except Exception:
+            if display_name.lower() == target:
+                return parent_shell_folder.BindToObject(child_pidl, None, _IID_IShellFolder)
+        except pywintypes.com_error:
             continue
     return None
 
 
+# Parsing name of "This PC" (CLSID_MyComputer); the same in every language
+_THIS_PC_PARSING_NAME = '::{20D04FE0-3AEA-1069-A2D8-08002B30309D}'
+
+
+def _parse_shell_folder(desktop, parsing_name: str):
+    """Resolve an absolute parsing name with one SHParseDisplayName call; None if it doesn't parse."""
+    try:
+        pidl, _attrs = shell.SHParseDisplayName(parsing_name, 0, None)
+        return desktop.BindToObject(pidl, None, _IID_IShellFolder)
+    except Exception:
+        return None
+
+
 def _find_iphone_storage(log=None) -> tuple:
     """
     Find the iPhone's Internal Storage shell folder.
@@ -106,13 +231,17 @@ def _find_iphone_storage(log=None) -> tuple:
     # Common names for "This PC" in different languages
     this_pc_names = ['This PC', 'Este equipo', 'Aquest equip', 'Dieser PC', 'Ce PC']
     
-    this_pc = None
-    for name in this_pc_names:
-        this_pc = _get_child_shell_folder(desktop, name)
-        if this_pc:
-            if log:
-                log(f'Found "This PC" as "{name}"')
-            break
+    this_pc = _parse_shell_folder(desktop, _THIS_PC_PARSING_NAME)
+    if this_pc:
+        if log:
+            log('Found "This PC" by parsing name')
+    else:
+        for name in this_pc_names:
+            this_pc = _get_child_shell_folder(desktop, name)
+            if this_pc:
+                if log:
+                    log(f'Found "This PC" as "{name}"')
+                break
     
     if not this_pc:
         if log:
@@ -126,12 +255,12 @@ def _find_iphone_storage(log=None) -> tuple:
         try:
             name = this_pc.GetDisplayNameOf(pidl, shellcon.SHGDN_NORMAL)
             if 'iphone' in name.lower() or 'apple' in name.lower():
-                iphone_folder = this_pc.BindToObject(pidl, None, shell.IID_IShellFolder)
+                iphone_folder = this_pc.BindToObject(pidl, None, _IID_IShellFolder)
                 iphone_name = name
                 if log:
                     log(f'Found iPhone: "{name}"')
                 break
-        except Exception:
+        except pywintypes.com_error:
             continue
     
     if not iphone_folder:
@@ -151,12 +280,12 @@ def _find_iphone_storage(log=None) -> tuple:
                 log(f'  iPhone child: "{name}"')
             for pattern in storage_names:
                 if pattern.lower() in name.lower():
-                    storage_folder = iphone_folder.BindToObject(pidl, None, shell.IID_IShellFolder)
+                    storage_folder = iphone_folder.BindToObject(pidl, None, _IID_IShellFolder)
                     storage_name = name
                     break
             if storage_folder:
                 break
-        except Exception:
+        except pywintypes.com_error:
             continue
     
     if storage_folder:
@@ -170,156 +299,272 @@ def _find_iphone_storage(log=None) -> tuple:
     return None, None
 
 
-def _walk_shell_folder(shell_folder, path: str, items: list, log, cancel_token, progress_cb, 
-                       items_cb, depth: int = 0, stats: dict = None, pending_items: list = None):
+# Subfolders are enumerated concurrently; MTP enumeration waits on USB round trips, not CPU.
+# Each walk thread initializes COM once and keeps its apartment for the whole walk.
+_WALK_WORKERS = 4
+_MAX_WALK_DEPTH = 16
+
+
+@dataclass(slots=True)
+class _FolderScan:
+    """Result of enumerating one folder: its media items and the subfolders still to visit."""
+    path: str
+    depth: int
+    # Position in a depth-first walk (child i of a folder appends i); sorts the merged items
+    order: tuple = ()
+    files: int = 0
+    items: list = field(default_factory=list)
+    # (bound folder or None, absolute PIDL as ITEMIDLIST bytes or None, display path)
+    children: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+
+def _scan_folder(shell_folder, folder_pidl_abs, path: str, depth: int, cancel_token,
+                 device_id: str) -> _FolderScan:
     """
-    Recursively walk a shell folder and collect media items.
-    Emits items in batches for real-time UI updates.
+    Enumerate one shell folder (files and subfolders) without recursing.
+    Subfolders with a known absolute PIDL are returned unbound, as PIDL bytes, so any
+    thread can bind them and no COM object outlives this call.
     """
-    if depth > 16:
-        return
-    
-    if cancel_token and cancel_token.cancelled:
-        raise ScanCancelled()
-    
-    if stats is None:
-        stats = {'folders': 0, 'files': 0, 'media': 0}
-    
-    if pending_items is None:
-        pending_items = []
-    
-    stats['folders'] += 1
-    
-    # Report progress with current folder
-    if progress_cb:
-        progress_cb(stats['media'], stats['folders'], path)
-    
-    # Enumerate folders first
+    result = _FolderScan(path=path, depth=depth)
     try:
-        for folder_pidl in shell_folder.EnumObjects(0, shellcon.SHCONTF_FOLDERS):
-            if cancel_token and cancel_token.cancelled:
-                raise ScanCancelled()
+        # Only the root needs a shell call; subfolders get parent PIDL + child item
+        if folder_pidl_abs is None:
             try:
-                child_folder = shell_folder.BindToObject(folder_pidl, None, shell.IID_IShellFolder)
-                folder_name = shell_folder.GetDisplayNameOf(folder_pidl, shellcon.SHGDN_NORMAL)
-                child_path = f'{path}\\{folder_name}' if path else folder_name
-                
-                if stats['folders'] <= 20:
-                    log(f'📁 {child_path}')
-                
-                _walk_shell_folder(child_folder, child_path, items, log, cancel_token, 
-                                   progress_cb, items_cb, depth + 1, stats, pending_items)
-            except Exception as e:
-                log(f'Error accessing folder: {e}')
-                continue
-    except Exception as e:
-        log(f'Error enumerating folders in {path}: {e}')
-    
-    # Enumerate files
-    try:
-        folder_pidl_abs = None
+                folder_pidl_abs = shell.SHGetIDListFromObject(shell_folder)
+            except Exception:
+                folder_pidl_abs = None
+        # Serialized once; each file's object_id only appends its own item bytes
+        folder_id_prefix = None
+        if folder_pidl_abs:
+            try:
+                folder_id_prefix = _pidl_to_bytes(folder_pidl_abs)
+            except Exception:
+                folder_id_prefix = None
+        # Fallback ids: the folder's absolute parsing name (resolved once, on first use)
+        # joined with each file's parent-relative parsing name, which is local to the PIDL
+        folder_parse_prefix = None
+        shgdn_relative_parsing = shellcon.SHGDN_INFOLDER | shellcon.SHGDN_FORPARSING
+
         try:
-            folder_pidl_abs = shell.SHGetIDListFromObject(shell_folder)
+            folder2 = shell_folder.QueryInterface(_IID_IShellFolder2)
         except Exception:
-            folder_pidl_abs = None
+            folder2 = None
+
+        # Bound once per folder: the loop below runs for every child
+        get_attributes = shell_folder.GetAttributesOf
+        get_display_name = shell_folder.GetDisplayNameOf
+        sfgao_folder = shellcon.SFGAO_FOLDER
+        shgdn_normal = shellcon.SHGDN_NORMAL
+        path_prefix = f'{path}\\' if path else ''
 
-        folder_new_items = []
-        for file_pidl in shell_folder.EnumObjects(0, shellcon.SHCONTF_NONFOLDERS):
+        child_folder_pidls = []
+        for child_pidl in shell_folder.EnumObjects(0, _ENUM_FLAGS):
             if cancel_token and cancel_token.cancelled:
                 raise ScanCancelled()
             try:
-                stats['files'] += 1
+                if get_attributes([child_pidl], sfgao_folder) & sfgao_folder:
+                    child_folder_pidls.append(child_pidl)
+                    continue
+
+                result.files += 1
                 
                 # Get file info
-                file_name = shell_folder.GetDisplayNameOf(file_pidl, shellcon.SHGDN_NORMAL)
-                extension = Path(file_name).suffix.lower()
+                file_name = get_display_name(child_pidl, shgdn_normal)
+                dot = file_name.rfind('.')
+                extension = file_name[dot:].lower() if dot > 0 else ''
                 
                 # Check if media
-                if extension not in PHOTO_EXTS and extension not in VIDEO_EXTS:
+                if extension not in _MEDIA_EXTS:
                     continue
                 
-                stats['media'] += 1
-                
-                # Get shell item for more info
-                try:
-                    if folder_pidl_abs:
-                        pidl_abs_file = shell.ILCombine(folder_pidl_abs, file_pidl)
-                        shell_item = shell.SHCreateItemFromIDList(pidl_abs_file, shell.IID_IShellItem)
-                    else:
-                        pidl_abs_file = None
-                        shell_item = shell.SHCreateShellItem(None, None, file_pidl)
-
-                    object_id = None
-                    if pidl_abs_file:
-                        object_id = _pidl_to_object_id(pidl_abs_file)
-
-                    if not object_id:
-                        try:
-                            object_id = shell_item.GetDisplayName(shellcon.SIGDN_DESKTOPABSOLUTEPARSING)
-                        except Exception:
-                            object_id = None
+                # Display path is composed from the walk path; no per-file shell call needed
+                abs_path = path_prefix + file_name
 
+                # Parsing names are only used when the PIDL can't be serialized
+                object_id = None
+                if folder_id_prefix is not None:
                     try:
-                        abs_path = shell_item.GetDisplayName(shellcon.SIGDN_DESKTOPABSOLUTEEDITING)
+                        object_id = _encode_object_id(folder_id_prefix + _pidl_to_bytes(child_pidl))
                     except Exception:
-                        abs_path = f'{path}\\{file_name}' if path else file_name
-                except Exception:
-                    object_id = None
-                    pidl_abs_file = None
-                    abs_path = f'{path}\\{file_name}' if path else file_name
-                    shell_item = None
+                        object_id = None
+                if not object_id and folder_pidl_abs:
+                    with suppress(pywintypes.com_error):
+                        if folder_parse_prefix is None:
+                            folder_item = shell.SHCreateItemFromIDList(folder_pidl_abs, _IID_IShellItem)
+                            folder_parse_prefix = (
+                                folder_item.GetDisplayName(shellcon.SIGDN_DESKTOPABSOLUTEPARSING) + '\\'
+                            )
+                        object_id = folder_parse_prefix + get_display_name(child_pidl, shgdn_relative_parsing)
                 
-                # Try to get size/created using property store (language-independent)
-                size = -1
-                created = None
-                if pidl_abs_file:
-                    try:
-                        store = propsys.SHGetPropertyStoreFromIDList(pidl_abs_file)
-                    except Exception:
-                        store = None
-                    if store:
-                        try:
-                            size_val = store.GetValue(pscon.PKEY_Size).GetValue()
-                            if size_val is not None:
-                                size = int(size_val)
-                        except Exception:
-                            pass
-                        for key in (pscon.PKEY_Photo_DateTaken, pscon.PKEY_Media_DateEncoded, pscon.PKEY_DateCreated):
-                            try:
-                                dt_val = store.GetValue(key).GetValue()
-                                created = _coerce_datetime(dt_val)
-                                if created:
-                                    break
-                            except Exception:
-                                continue
+                size, created = _get_file_details(folder2, child_pidl, folder_pidl_abs)
                 
-                # Create MediaItem
-                item = MediaItem(
-                    device_id='shell',  # Will be updated by caller
-                    object_id=object_id or abs_path,  # Robust object_id preferred
-                    name=file_name,
-                    extension=extension,
-                    size=size,
-                    created=created,
-                    device_path=abs_path or (f'{path}\\{file_name}' if path else file_name),
-                    content_type='',
+                result.items.append(
+                    MediaItem(
+                        device_id=device_id,
+                        object_id=object_id or abs_path,  # Robust object_id preferred
+                        name=file_name,
+                        extension=extension,
+                        size=size,
+                        created=created,
+                        device_path=abs_path,
+                        content_type='',
+                    )
                 )
-                items.append(item)
-                folder_new_items.append(item)
-                
-                if stats['media'] <= 20:
-                    log(f'  📷 {file_name}')
-                    
+            except ScanCancelled:
+                raise
             except Exception as e:
-                log(f'Error processing file: {e}')
+                result.errors.append(f'Error processing file: {e}')
                 continue
-        
-        # Emit batch of items found in this folder for real-time UI updates
-        if folder_new_items and items_cb:
-            items_cb(folder_new_items)
-            
+        # Only the file loop reads details; release the extra folder interface early
+        folder2 = None
+
+        # Subfolder names only feed display paths and logs; the in-folder name is
+        # answered from the item's own data instead of building a full display name
+        shgdn_infolder = shellcon.SHGDN_INFOLDER
+        for folder_pidl in child_folder_pidls:
+            try:
+                folder_name = get_display_name(folder_pidl, shgdn_infolder)
+                child_path = f'{path_prefix}{folder_name}'
+                if folder_id_prefix is not None:
+                    result.children.append((None, folder_id_prefix + _pidl_to_bytes(folder_pidl), child_path))
+                else:
+                    # No absolute PIDL to hand over: bind here and keep it on this thread
+                    child_folder = shell_folder.BindToObject(folder_pidl, None, _IID_IShellFolder)
+                    result.children.append((child_folder, None, child_path))
+            except pywintypes.com_error as e:
+                result.errors.append(f'Error accessing folder: {e}')
+    except ScanCancelled:
+        raise
+    except Exception as e:
+        result.errors.append(f'Error enumerating {path}: {e}')
+    return result
+
+
+def _scan_folder_by_pidl(folder_pidl_bytes: bytes, path: str, depth: int, cancel_token,
+                         device_id: str) -> _FolderScan:
+    """Walk worker task: bind the folder from its absolute PIDL bytes in the worker's apartment."""
+    try:
+        folder_pidl_abs = _bytes_to_pidl(folder_pidl_bytes)
+        shell_folder = _get_desktop_shell_folder().BindToObject(folder_pidl_abs, None, _IID_IShellFolder)
+    except Exception as e:
+        result = _FolderScan(path=path, depth=depth)
+        result.errors.append(f'Error accessing folder: {e}')
+        return result
+    return _scan_folder(shell_folder, folder_pidl_abs, path, depth, cancel_token, device_id)
+
+
+def _walk_worker(tasks: queue.SimpleQueue, results: queue.SimpleQueue, cancel_token, device_id: str) -> None:
+    """
+    Walk thread: enters one COM apartment and scans folders from tasks until it gets None.
+    Results (or the exception a scan raised) go to results, one per task; a failure
+    outside a scan (e.g. entering the apartment) is posted too, so the caller never waits
+    on a dead thread.
+    """
+    try:
+        with com_apartment():
+            while True:
+                task = tasks.get()
+                if task is None:
+                    return
+                folder_pidl_bytes, path, depth, order = task
+                try:
+                    result = _scan_folder_by_pidl(folder_pidl_bytes, path, depth, cancel_token, device_id)
+                    result.order = order
+                except Exception as e:
+                    result = e
+                results.put(result)
     except Exception as e:
-        log(f'Error enumerating files in {path}: {e}')
+        results.put(e)
+
+
+def _walk_shell_folder(shell_folder, path: str, items: list, log, cancel_token, progress_cb,
+                       items_cb, stats: dict, device_id: str = 'shell'):
+    """
+    Walk a shell folder tree and collect media items.
+    Folders are enumerated by up to _WALK_WORKERS threads, each living for the whole walk
+    in its own COM apartment; results are merged on the calling thread, which owns
+    items, stats, logging and the callbacks.
+    Emits items in per-folder batches for real-time UI updates, in arrival order; items
+    itself is filled in walk order (subfolders first, then the folder's own files).
+    """
+    pending = deque([(shell_folder, None, path, 0, ())])
+    tasks: queue.SimpleQueue = queue.SimpleQueue()
+    results: queue.SimpleQueue = queue.SimpleQueue()
+    workers: list[threading.Thread] = []
+    running = 0
+    batches: list[tuple[tuple, list]] = []
+
+    def merge(result: _FolderScan) -> None:
+        stats['folders'] += 1
+        stats['files'] += result.files
+        if result.depth > 0 and stats['folders'] <= 20:
+            log(f'📁 {result.path}')
+        for message in result.errors:
+            _log_error(log, stats, message)
+        for item in result.items:
+            stats['media'] += 1
+            if stats['media'] <= 20:
+                log(f'  📷 {item.name}')
+        # Own files sort after every subfolder of this folder
+        batches.append((result.order + (len(result.children),), result.items))
+        # Report progress with current folder
+        if progress_cb:
+            progress_cb(stats['media'], stats['folders'], result.path)
+        # Emit batch of items found in this folder for real-time UI updates
+        if result.items and items_cb:
+            items_cb(result.items)
+        if result.depth < _MAX_WALK_DEPTH:
+            for i, (child_folder, child_pidl_bytes, child_path) in enumerate(result.children):
+                pending.append((child_folder, child_pidl_bytes, child_path, result.depth + 1, result.order + (i,)))
+        result.children.clear()
+
+    try:
+        while pending or running:
+            if cancel_token and cancel_token.cancelled:
+                raise ScanCancelled()
+            while pending:
+                folder, folder_pidl_bytes, folder_path, depth, order = pending.popleft()
+                if folder is None:
+                    tasks.put((folder_pidl_bytes, folder_path, depth, order))
+                    running += 1
+                    # Threads are started as the queue needs them, never more than _WALK_WORKERS
+                    if len(workers) < min(running, _WALK_WORKERS):
+                        worker = threading.Thread(
+                            target=_walk_worker,
+                            args=(tasks, results, cancel_token, device_id),
+                            name=f'shell-walk-{len(workers)}',
+                            daemon=True,
+                        )
+                        worker.start()
+                        workers.append(worker)
+                else:
+                    # Folder objects bound on this thread are enumerated here
+                    result = _scan_folder(folder, None, folder_path, depth, cancel_token, device_id)
+                    result.order = order
+                    merge(result)
+                    # Drop the bound folder now rather than when the loop variable is rebound
+                    folder = None
+            if running:
+                result = results.get()
+                running -= 1
+                if isinstance(result, Exception):
+                    raise result
+                merge(result)
+        batches.sort(key=lambda batch: batch[0])
+        for _, batch_items in batches:
+            items.extend(batch_items)
+    finally:
+        # Drop queued folders, then stop each worker after its current one
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join()
 
 
 ProgressCb = Optional[Callable[[int, int, str], None]]
@@ -337,38 +582,31 @@ def list_media_items_shell(
     This is more reliable than WPD for iPhones.
     Emits items in real-time via items_cb for UI responsiveness.
     """
-    log, log_path = _make_scan_logger()
+    log, log_path, close_log = _make_scan_logger()
     items: list[MediaItem] = []
     
     log(f'Start shell scan device_id={device_id}')
     
-    pythoncom.CoInitialize()
     try:
-        # Find iPhone storage
-        storage_folder, storage_path = _find_iphone_storage(log)
-        
-        if not storage_folder:
-            log('ERROR: Could not find iPhone storage')
-            raise ScanError('error_device_not_found', detail='Could not find iPhone Internal Storage')
-        
-        log(f'Starting walk of {storage_path}')
-        stats = {'folders': 0, 'files': 0, 'media': 0}
-        
-        # Wrap items_cb to update device_id before emitting
-        def items_cb_wrapper(new_items):
-            for item in new_items:
-                item.device_id = device_id
-            if items_cb:
-                items_cb(new_items)
-        
-        _walk_shell_folder(storage_folder, storage_path, items, log, cancel_token, 
-                           progress_cb, items_cb_wrapper, depth=0, stats=stats)
-        
-        # Update device_id in all items (for items added before wrapper was set)
-        for item in items:
-            item.device_id = device_id
-        
-        log(f'Finished scan. folders={stats["folders"]} files={stats["files"]} media={stats["media"]}')
+        with com_apartment():
+            # Find iPhone storage
+            storage_folder, storage_path = _find_iphone_storage(log)
+            
+            if not storage_folder:
+                log('ERROR: Could not find iPhone storage')
+                raise ScanError('error_device_not_found', detail='Could not find iPhone Internal Storage')
+            
+            log(f'Starting walk of {storage_path}')
+            stats = {'folders': 0, 'files': 0, 'media': 0, 'errors': 0}
+            
+            # Items are created with their final device_id and appended straight into items
+            _walk_shell_folder(storage_folder, storage_path, items, log, cancel_token,
+                               progress_cb, items_cb, stats, device_id)
+            
+            log(
+                f'Finished scan. folders={stats["folders"]} files={stats["files"]} '
+                f'media={stats["media"]} errors={stats["errors"]}'
+            )
         
     except ScanCancelled:
         log('Scan cancelled by user')
@@ -382,11 +620,257 @@ def list_media_items_shell(
         log(tb)
         raise ScanError('error_scan_failed', detail=str(log_path)) from exc
     finally:
-        pythoncom.CoUninitialize()
+        close_log()
     
     return items
 
 
+# Silent copies that also skip registered copy hooks (AV / sync shell extensions)
+# and the progress dialog details. Literals cover pywin32 builds without FOFX_*.
+_COPY_FLAGS = (
+    shellcon.FOF_NO_UI
+    | shellcon.FOF_NOCONFIRMATION
+    | shellcon.FOF_SILENT
+    | getattr(shellcon, 'FOFX_NOCOPYHOOKS', 0x00800000)
+    | getattr(shellcon, 'FOFX_NOMINIMIZEBOX', 0x01000000)
+    | getattr(shellcon, 'FOFX_DONTDISPLAYSOURCEPATH', 0x04000000)
+    | getattr(shellcon, 'FOFX_DONTDISPLAYDESTPATH', 0x08000000)
+)
+
+
+def _hresult(code: int) -> int:
+    return code & 0xFFFFFFFF
+
+
+# Copy results after which the rest of the batch can only fail as well
+_TERMINAL_COPY_ERRORS = frozenset(
+    _hresult(code)
+    for code in (
+        winerror.STG_E_MEDIUMFULL,
+        winerror.HRESULT_FROM_WIN32(winerror.ERROR_DISK_FULL),
+        winerror.HRESULT_FROM_WIN32(winerror.ERROR_DEVICE_NOT_CONNECTED),
+        winerror.HRESULT_FROM_WIN32(winerror.ERROR_DEV_NOT_EXIST),
+    )
+)
+
+
+class _CopySink:
+    """
+    IFileOperationProgressSink for ShellCopyBatch: reports each finished copy to copied_cb
+    (by full target path) and cancels the operation on cancel or on the first terminal copy error.
+    Every sink method must be implemented: a missing one fails the call, which cancels the copy.
+    """
+
+    _com_interfaces_ = [shell.IID_IFileOperationProgressSink]
+    _public_methods_ = [
+        'StartOperations', 'FinishOperations',
+        'PreRenameItem', 'PostRenameItem', 'PreMoveItem', 'PostMoveItem',
+        'PreCopyItem', 'PostCopyItem', 'PreDeleteItem', 'PostDeleteItem',
+        'PreNewItem', 'PostNewItem', 'UpdateProgress',
+        'ResetTimer', 'PauseTimer', 'ResumeTimer',
+    ]
+
+    def __init__(self, names: dict[str, deque], copied_cb, cancel_token) -> None:
+        self.terminal_hr: int | None = None
+        self._names = names
+        self._copied_cb = copied_cb
+        self._cancel_token = cancel_token
+
+    def PostCopyItem(self, flags, item, dest_folder, new_name, hr_copy, new_item):
+        hr = _hresult(hr_copy)
+        if hr in _TERMINAL_COPY_ERRORS:
+            self.terminal_hr = hr
+            # A failing sink call makes IFileOperation stop the remaining copies
+            raise COMException(hresult=winerror.E_ABORT)
+        if self._copied_cb is not None and hr < 0x80000000:
+            # An exception escaping here would cancel the whole batch
+            try:
+                folder = dest_folder.GetDisplayName(shellcon.SIGDN_FILESYSPATH)
+                indices = self._names.get(os.path.normcase(os.path.join(folder, new_name)))
+                if indices:
+                    self._copied_cb(indices.popleft())
+            except Exception as e:
+                logger.warning('Shell copy callback error: %s', e)
+        if self._cancel_token and self._cancel_token.cancelled:
+            raise COMException(hresult=winerror.E_ABORT)
+
+    def StartOperations(self):
+        pass
+
+    def FinishOperations(self, hr_result):
+        pass
+
+    def PreRenameItem(self, flags, item, new_name):
+        pass
+
+    def PostRenameItem(self, flags, item, new_name, hr_rename, new_item):
+        pass
+
+    def PreMoveItem(self, flags, item, dest_folder, new_name):
+        pass
+
+    def PostMoveItem(self, flags, item, dest_folder, new_name, hr_move, new_item):
+        pass
+
+    def PreCopyItem(self, flags, item, dest_folder, new_name):
+        pass
+
+    def PreDeleteItem(self, flags, item):
+        pass
+
+    def PostDeleteItem(self, flags, item, hr_delete, new_item):
+        pass
+
+    def PreNewItem(self, flags, dest_folder, new_name):
+        pass
+
+    def PostNewItem(self, flags, dest_folder, new_name, template_name, attributes, hr_new, new_item):
+        pass
+
+    def UpdateProgress(self, work_total, work_so_far):
+        pass
+
+    def ResetTimer(self):
+        pass
+
+    def PauseTimer(self):
+        pass
+
+    def ResumeTimer(self):
+        pass
+
+
+class ShellCopyBatch:
+    """
+    Queue shell copies on a single IFileOperation and run them together on exit.
+
+        with ShellCopyBatch() as batch:
+            batch.add(object_id, dest_path)
+
+    After the block, batch.results holds one success flag per add() call, in order.
+    copied_cb(index), if given, is called as each copy lands during the run.
+    Cancelling cancel_token, a full disk or a disconnected device stops the remaining
+    copies of the batch.
+    """
+
+    def __init__(self, copied_cb=None, cancel_token=None) -> None:
+        self.results: list[bool] = []
+        self._copied_cb = copied_cb
+        self._cancel_token = cancel_token
+        self._op = None
+        self._com = None
+        self._dest_folders: dict[Path, object] = {}
+        self._queued: list[tuple[int, Path]] = []
+        # Normalized target path -> indices queued for it, for the sink to map finished
+        # copies back; a leaf name alone is ambiguous across destination folders
+        self._names: dict[str, deque] = {}
+        self._sink: _CopySink | None = None
+        self._sink_cookie = None
+
+    def __enter__(self) -> ShellCopyBatch:
+        self._com = com_apartment()
+        self._com.__enter__()
+        try:
+            # Create file operation
+            self._op = pythoncom.CoCreateInstance(
+                shell.CLSID_FileOperation,
+                None,
+                pythoncom.CLSCTX_ALL,
+                shell.IID_IFileOperation
+            )
+            self._op.SetOperationFlags(_COPY_FLAGS)
+        except Exception:
+            self._com.__exit__(None, None, None)
+            raise
+        return self
+
+    def add(self, object_id: str, dest_path: Path) -> int:
+        """Queue one copy; returns its index in results."""
+        index = len(self.results)
+        self.results.append(False)
+        # Path.parent / Path.name build new objects on every access; take them once
+        parent = dest_path.parent
+        name = dest_path.name
+        try:
+            dest_folder = self._dest_folders.get(parent)
+            if dest_folder is None:
+                parent.mkdir(parents=True, exist_ok=True)
+                dest_folder = shell.SHCreateItemFromParsingName(str(parent), None, _IID_IShellItem)
+                self._dest_folders[parent] = dest_folder
+            source_item = _object_id_to_shell_item(object_id)
+            self._op.CopyItem(source_item, dest_folder, name, None)
+            self._queued.append((index, dest_path))
+            if self._copied_cb is not None:
+                key = os.path.normcase(os.path.join(str(parent), name))
+                self._names.setdefault(key, deque()).append(index)
+        except Exception as e:
+            logger.warning('Shell download error for %s: %s', name, e)
+        return index
+
+    def _advise(self) -> None:
+        # Without the sink the batch still works, it just doesn't stop early
+        try:
+            sink = _CopySink(self._names, self._copied_cb, self._cancel_token)
+            self._sink_cookie = self._op.Advise(wrap(sink, shell.IID_IFileOperationProgressSink))
+            self._sink = sink
+        except Exception as e:
+            logger.warning('Shell progress sink not available: %s', e)
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None and self._queued:
+                # Stopping early only pays off when other copies come after the failing one
+                if len(self._queued) > 1 or self._copied_cb is not None:
+                    self._advise()
+                try:
+                    self._op.PerformOperations()
+                except Exception as e:
+                    logger.warning('Shell download error: %s', e)
+                if self._sink is not None and self._sink.terminal_hr is not None:
+                    logger.warning('Shell copy stopped early: 0x%08X', self._sink.terminal_hr)
+                for index, dest_path in self._queued:
+                    self.results[index] = dest_path.exists()
+        finally:
+            if self._sink_cookie is not None:
+                try:
+                    self._op.Unadvise(self._sink_cookie)
+                except Exception:
+                    pass
+            self._sink = None
+            self._sink_cookie = None
+            self._op = None
+            self._dest_folders.clear()
+            self._names.clear()
+            self._com.__exit__(exc_type, exc, tb)
+        return False
+
+
+def download_files_shell(
+    pairs: list[tuple[str, Path]],
+    cancel_token=None,
+    copied_cb=None,
+) -> list[bool]:
+    """
+    Download several files through the shell in one IFileOperation (see ShellCopyBatch).
+    Returns one success flag per (object_id, dest_path) pair, in order; copied_cb(index)
+    reports each pair as its copy lands.
+    """
+    results = [False] * len(pairs)
+    if cancel_token and cancel_token.cancelled:
+        return results
+    try:
+        with ShellCopyBatch(copied_cb, cancel_token) as batch:
+            for object_id, dest_path in pairs:
+                if cancel_token and cancel_token.cancelled:
+                    break
+                batch.add(object_id, dest_path)
+    except Exception as e:
+        logger.warning('Shell download error: %s', e)
+        return results
+    results[:len(batch.results)] = batch.results
+    return results
+
+
 def download_file_shell(
     object_id: str,  # PIDL or absolute shell parsing name
     dest_path: Path,
@@ -397,42 +881,12 @@ def download_file_shell(
     Download a file from iPhone using Windows Shell API.
     object_id can be a PIDL token or an absolute shell parsing name (e.g., "This PC\Apple iPhone\Internal Storage\DCIM\...").
     """
-    pythoncom.CoInitialize()
+    if cancel_token and cancel_token.cancelled:
+        return False
     try:
-        # Create destination folder
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Get source shell item
-        source_item = _object_id_to_shell_item(object_id)
-        
-        # Get destination folder shell item
-        dest_folder = shell.SHCreateItemFromParsingName(str(dest_path.parent), None, shell.IID_IShellItem)
-        
-        # Create file operation
-        pfo = pythoncom.CoCreateInstance(
-            shell.CLSID_FileOperation,
-            None,
-            pythoncom.CLSCTX_ALL,
-            shell.IID_IFileOperation
-        )
-        
-        # Set flags for silent operation
-        pfo.SetOperationFlags(
-            shellcon.FOF_NO_UI |
-            shellcon.FOF_NOCONFIRMATION |
-            shellcon.FOF_SILENT
-        )
-        
-        # Queue copy operation
-        pfo.CopyItem(source_item, dest_folder, dest_path.name, None)
-        
-        # Execute
-        pfo.PerformOperations()
-        
-        return dest_path.exists()
-        
+        with ShellCopyBatch() as batch:
+            batch.add(object_id, dest_path)
     except Exception as e:
-        print(f'Shell download error: {e}')
+        logger.warning('Shell download error: %s', e)
         return False
-    finally:
-        pythoncom.CoUninitialize()
+    return batch.results[0]
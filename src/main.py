@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 
 from infrastructure.fs.path_utils import resource_path
 from ui.app import WizardWindow
@@ -23,7 +23,10 @@ def main() -> int:
     _load_style(app)
     window = WizardWindow()
     window.show()
-    return app.exec()
+    code = app.exec()
+    # Let pooled jobs (config save, cancelled scan/import) finish before the process exits
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    return code
 
 
 if __name__ == '__main__':
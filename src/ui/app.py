@@ -5,22 +5,28 @@ from pathlib import Path
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from application.build_plan import build_plan
-from application.detect_devices import detect_iphone_devices
 from application.convert_media import conversion_available
 from domain import CancelToken, DeviceInfo, ImportOptions
+from domain.rules import preset_to_template
 from infrastructure.fs.config_store import load_config, save_config
 from infrastructure.fs.path_utils import get_app_root
 from ui.translator import Translator, detect_system_language
 from ui.wizard import DevicePage, ImportPage, OptionsPage, ScanPage, StepIndicator
-from ui.workers import ScanWorker, TransferWorker
+from ui.workers import DeviceDetectWorker, ScanWorker, TransferWorker
 
 
 class WizardWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self._app_root = get_app_root()
+        # Tools in ./tools do not change while the app runs; probe once
+        self._conversion_available = conversion_available(self._app_root)
         self._translator = Translator()
         self._config = load_config(self._app_root)
+        # One thread, so queued config writes land on disk in the order they were made
+        self._config_pool = QtCore.QThreadPool(self)
+        self._config_pool.setMaxThreadCount(1)
+        self._detect_worker: DeviceDetectWorker | None = None
         self._scan_worker: ScanWorker | None = None
         self._transfer_worker: TransferWorker | None = None
         self._cancel_token: CancelToken | None = None
@@ -28,11 +34,18 @@ class WizardWindow(QtWidgets.QMainWindow):
         self._devices: list[DeviceInfo] = []
         self._selected_device: DeviceInfo | None = None
         self._scan_result = None
+        self._preview_sig: tuple | None = None
         self._plan = None
         self._import_running = False
         self._last_log_path: Path | None = None
         self._last_dest: Path | None = None
 
+        # Coalesce bursts of option changes (typing) into one preview rebuild
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(200)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+
         self._apply_language_from_config()
         self._build_ui()
         self._apply_config_to_ui()
@@ -68,6 +81,7 @@ class WizardWindow(QtWidgets.QMainWindow):
         self.lang_combo.addItem('Español', 'es')
         self.lang_combo.addItem('English', 'en')
         self.lang_combo.addItem('Català', 'ca')
+        self._lang_index = {self.lang_combo.itemData(i): i for i in range(self.lang_combo.count())}
         header.addWidget(self.lang_combo)
 
         self.step_indicator = StepIndicator(self._translator)
@@ -82,6 +96,14 @@ class WizardWindow(QtWidgets.QMainWindow):
         self.stack.addWidget(self.options_page)
         self.stack.addWidget(self.import_page)
 
+        # One fade effect per page, enabled only while its animation runs
+        self._page_effects: dict[QtWidgets.QWidget, QtWidgets.QGraphicsOpacityEffect] = {}
+        for page in (self.device_page, self.scan_page, self.options_page, self.import_page):
+            effect = QtWidgets.QGraphicsOpacityEffect(page)
+            effect.setEnabled(False)
+            page.setGraphicsEffect(effect)
+            self._page_effects[page] = effect
+
         nav = QtWidgets.QHBoxLayout()
         self.back_btn = QtWidgets.QPushButton()
         self.next_btn = QtWidgets.QPushButton()
@@ -125,13 +147,13 @@ class WizardWindow(QtWidgets.QMainWindow):
 
     def _apply_config_to_ui(self) -> None:
         lang = self._translator.language()
-        idx = self.lang_combo.findData(lang)
-        if idx >= 0:
+        idx = self._lang_index.get(lang)
+        if idx is not None:
             self.lang_combo.setCurrentIndex(idx)
 
         preset = self._config.get('structure_preset', 'A')
-        preset_idx = self.options_page.preset_combo.findData(preset)
-        if preset_idx >= 0:
+        preset_idx = self.options_page.preset_index.get(preset)
+        if preset_idx is not None:
             self.options_page.preset_combo.setCurrentIndex(preset_idx)
 
         self.options_page.template_edit.setText(self._config.get('template', '{YYYY}/{MM}/'))
@@ -141,7 +163,7 @@ class WizardWindow(QtWidgets.QMainWindow):
 
         self._update_conversion_availability()
 
-    def _save_config_from_ui(self) -> None:
+    def _save_config_from_ui(self, wait: bool = False) -> None:
         data = {
             'language': self._translator.language(),
             'structure_preset': self.options_page.preset(),
@@ -150,7 +172,14 @@ class WizardWindow(QtWidgets.QMainWindow):
             'keep_live': self.options_page.live_checkbox.isChecked(),
             'create_compat': self.options_page.compat_checkbox.isChecked(),
         }
-        save_config(self._app_root, data)
+        if wait:
+            # Let earlier queued writes finish first so this snapshot is the last one written
+            self._config_pool.waitForDone()
+            save_config(self._app_root, data)
+            return
+        # Widgets are read here; the disk write happens off the GUI thread
+        app_root = self._app_root
+        self._config_pool.start(lambda: save_config(app_root, data))
 
     def _retranslate(self) -> None:
         self.title_label.setText(self._translator.tr('app_title'))
@@ -165,12 +194,10 @@ class WizardWindow(QtWidgets.QMainWindow):
         self.next_btn.setText(self._translator.tr('next'))
         self.cancel_btn.setText(self._translator.tr('cancel'))
         self.device_page.retranslate()
-        self.device_page.set_devices(self._devices)
         self.scan_page.retranslate()
         self.options_page.retranslate()
         self.import_page.retranslate()
         self._update_nav_buttons()
-        self._update_preview()
 
     def _set_step(self, index: int) -> None:
         self.stack.setCurrentIndex(index)
@@ -179,12 +206,14 @@ class WizardWindow(QtWidgets.QMainWindow):
         self._update_nav_buttons()
 
     def _animate_page(self, widget: QtWidgets.QWidget) -> None:
-        effect = QtWidgets.QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
+        effect = self._page_effects[widget]
+        effect.setEnabled(True)
         anim = QtCore.QPropertyAnimation(effect, b'opacity', widget)
         anim.setDuration(240)
         anim.setStartValue(0.0)
         anim.setEndValue(1.0)
+        # Idle pages render directly instead of through the effect's offscreen buffer
+        anim.finished.connect(lambda: effect.setEnabled(False))
         anim.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
 
     def _update_nav_buttons(self) -> None:
@@ -208,17 +237,23 @@ class WizardWindow(QtWidgets.QMainWindow):
         return True
 
     def refresh_devices(self) -> None:
-        try:
-            devices = detect_iphone_devices()
-        except Exception:
-            # COM error or other WPD issue - show empty list
-            devices = []
+        if self._detect_worker:
+            return
+        self.device_page.refresh_btn.setEnabled(False)
+        self._detect_worker = DeviceDetectWorker()
+        self._detect_worker.detected.connect(self._on_devices_detected)
+        self._detect_worker.start()
+
+    def _on_devices_detected(self, devices: list) -> None:
+        self._detect_worker = None
+        self.device_page.refresh_btn.setEnabled(True)
         self._devices = devices
         self.device_page.set_devices(self._devices)
 
     def _on_device_selected(self, device: DeviceInfo) -> None:
         self._selected_device = device
         self._scan_result = None
+        self._preview_sig = None
         self.scan_page.set_scan_result(None)
         self._update_nav_buttons()
 
@@ -247,6 +282,7 @@ class WizardWindow(QtWidgets.QMainWindow):
         self._scan_worker = None
         self._scan_cancel_token = None
         self._scan_result = result
+        self._preview_sig = None
         self.scan_page.set_scanning(False)
         self.scan_page.scan_btn.setEnabled(True)
         self.scan_page.set_scan_result(result)
@@ -257,6 +293,7 @@ class WizardWindow(QtWidgets.QMainWindow):
         self._scan_worker = None
         self._scan_cancel_token = None
         self._scan_result = None
+        self._preview_sig = None
         self.scan_page.set_scanning(False)
         self.scan_page.scan_btn.setEnabled(True)
         self.scan_page.set_scan_cancelled()
@@ -281,10 +318,35 @@ class WizardWindow(QtWidgets.QMainWindow):
         self._update_nav_buttons()
 
     def _update_preview(self) -> None:
+        # Nothing meaningful to preview until a destination is chosen
+        if not self.options_page.destination():
+            self._preview_timer.stop()
+            self._preview_sig = None
+            self.options_page.set_preview([])
+            return
+        self._preview_timer.start()
+
+    def _do_update_preview(self) -> None:
         if not self._scan_result or not self._selected_device:
             return
-        dest = self.options_page.destination().strip() or '.'
+        dest = self.options_page.destination()
+        if not dest:
+            return
         options = self._build_options(Path(dest))
+        # Skip the rebuild when nothing that shapes the preview changed
+        sig = (
+            dest,
+            options.structure_preset,
+            options.template,
+            options.keep_live,
+            options.create_compat,
+            options.language,
+            id(self._scan_result),
+            id(self._selected_device),
+        )
+        if sig == self._preview_sig:
+            return
+        self._preview_sig = sig
         sample_items = self._scan_result.items[:200]
         preview_plan = build_plan(self._selected_device, sample_items, options)
         self.options_page.set_preview(preview_plan.preview_paths)
@@ -295,7 +357,7 @@ class WizardWindow(QtWidgets.QMainWindow):
         if self.options_page.use_advanced():
             preset = 'ADV'
         create_compat = self.options_page.compat_checkbox.isChecked()
-        if not conversion_available(self._app_root):
+        if not self._conversion_available:
             create_compat = False
         return ImportOptions(
             destination=destination,
@@ -347,7 +409,7 @@ class WizardWindow(QtWidgets.QMainWindow):
         self._update_nav_buttons()
 
         self._transfer_worker = TransferWorker(self._plan, self._selected_device, options, self._cancel_token)
-        self._transfer_worker.progress.connect(self.import_page.set_progress)
+        self._transfer_worker.progress.connect(self.import_page.set_progress, QtCore.Qt.QueuedConnection)
         self._transfer_worker.log.connect(self.import_page.append_log)
         self._transfer_worker.finished.connect(self._on_import_finished)
         self._transfer_worker.error.connect(self._on_import_error)
@@ -384,10 +446,20 @@ class WizardWindow(QtWidgets.QMainWindow):
         code = self.lang_combo.currentData()
         if code:
             self._translator.set_language(code)
+            # Preview paths only depend on the language through {TYPE} folder names
+            if self._preview_uses_type_label():
+                self._update_preview()
             self._save_config_from_ui()
 
+    def _preview_uses_type_label(self) -> bool:
+        if self.options_page.use_advanced():
+            template = self.options_page.template()
+        else:
+            template = preset_to_template(self.options_page.preset())
+        return '{TYPE}' in template
+
     def _update_conversion_availability(self) -> None:
-        available = conversion_available(self._app_root)
+        available = self._conversion_available
         if not available:
             self.options_page.compat_checkbox.setChecked(False)
         self.options_page.set_conversion_available(available)
@@ -403,5 +475,9 @@ class WizardWindow(QtWidgets.QMainWindow):
         QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(self._last_log_path)))
 
     def closeEvent(self, event) -> None:
-        self._save_config_from_ui()
+        # Stop running jobs so the thread pool can drain on exit
+        for token in (self._scan_cancel_token, self._cancel_token):
+            if token:
+                token.cancel()
+        self._save_config_from_ui(wait=True)
         super().closeEvent(event)
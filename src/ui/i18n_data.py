@@ -0,0 +1,210 @@
+# Generated by scripts/generate_i18n.py from src/ui/i18n/*.json. Do not edit.
+TRANSLATIONS = {
+    'en': {
+        'app_title': 'iImport',
+        'wizard_subtitle': 'Import photos and videos from iPhone',
+        'step_device': 'Device',
+        'step_scan': 'Scan',
+        'step_options': 'Destination',
+        'step_import': 'Import',
+        'back': 'Back',
+        'next': 'Next',
+        'cancel': 'Cancel',
+        'error_no_iphone': 'No iPhone detected.',
+        'error_scan_cancelled': 'Scan cancelled.',
+        'error_scan_failed': 'Scan failed.',
+        'error_import_cancelled': 'Import cancelled.',
+        'error_import_failed': 'Import failed.',
+        'error_tools_missing': 'Tools missing in ./tools. Copy ffmpeg.exe and exiftool.exe to ./tools (optional).',
+        'error_conversion_failed': 'Could not create compatible copy of {name}.',
+        'error_device_disconnected': 'Device disconnected.',
+        'close': 'Close',
+        'start_import': 'Start import',
+        'refresh': 'Refresh',
+        'scan': 'Scan device',
+        'browse': 'Browse…',
+        'device_instructions': 'Unlock your iPhone and tap “Trust” when prompted.',
+        'device_none': 'No iPhone detected.',
+        'device_select': 'Select a device',
+        'scan_summary': 'Summary',
+        'scan_photos': 'Photos',
+        'scan_videos': 'Videos',
+        'scan_total_size': 'Estimated size',
+        'scan_date_range': 'Date range',
+        'scanning': 'Scanning…',
+        'table_name': 'Name',
+        'table_type': 'Type',
+        'table_date': 'Date',
+        'table_size': 'Size',
+        'table_path': 'Device path',
+        'structure_label': 'Structure',
+        'destination_label': 'Destination folder',
+        'preset_a': 'A) Year/Month',
+        'preset_b': 'B) Year/Month/Day',
+        'preset_c': 'C) All together (Import_iPhone)',
+        'preset_d': 'D) By type + Year/Month',
+        'preset_e': 'E) By week',
+        'preset_f': 'F) By device + Year/Month',
+        'advanced_toggle': 'More options…',
+        'template_label': 'Template',
+        'template_hint': 'Tokens: {YYYY} {MM} {DD} {WW} {DEVICE} {TYPE}',
+        'preview_label': 'Preview (first 20)',
+        'compat_checkbox': 'Create compatible copies',
+        'compat_help': 'Originals are kept and compatible JPG/MP4 copies are created.',
+        'compat_missing': 'Tools missing in ./tools. Copy ffmpeg.exe and exiftool.exe to ./tools (optional).',
+        'live_checkbox': 'Keep Live Photos together',
+        'import_preview': 'Final preview (first 20)',
+        'progress_global': 'Overall progress',
+        'progress_file': 'Current file',
+        'log_live': 'Live log',
+        'summary_title': 'Summary',
+        'summary_copied': 'Copied',
+        'summary_skipped': 'Skipped',
+        'summary_failed': 'Failed',
+        'summary_converted': 'Compatible copies',
+        'open_destination': 'Open destination',
+        'open_log': 'View log',
+        'status_ready': 'Ready',
+        'status_importing': 'Importing…',
+        'status_done': 'Done',
+        'status_cancelled': 'Cancelled',
+    },
+    'es': {
+        'app_title': 'iImport',
+        'wizard_subtitle': 'Importa fotos y vídeos desde iPhone',
+        'step_device': 'Dispositivo',
+        'step_scan': 'Escaneo',
+        'step_options': 'Destino',
+        'step_import': 'Importación',
+        'back': 'Atrás',
+        'next': 'Siguiente',
+        'cancel': 'Cancelar',
+        'error_no_iphone': 'No se detecta iPhone.',
+        'error_scan_cancelled': 'Scan cancelado.',
+        'error_scan_failed': 'Scan falló.',
+        'error_import_cancelled': 'Import cancelado.',
+        'error_import_failed': 'Import falló.',
+        'error_tools_missing': 'Faltan herramientas en ./tools. Copia ffmpeg.exe y exiftool.exe a ./tools (opcional).',
+        'error_conversion_failed': 'No se pudo crear copia compatible de {name}.',
+        'error_device_disconnected': 'Dispositivo desconectado.',
+        'close': 'Cerrar',
+        'start_import': 'Iniciar importación',
+        'refresh': 'Actualizar',
+        'scan': 'Escanear dispositivo',
+        'browse': 'Elegir…',
+        'device_instructions': 'Desbloquea el iPhone y pulsa “Confiar” cuando aparezca.',
+        'device_none': 'No se detecta iPhone.',
+        'device_select': 'Selecciona un dispositivo',
+        'scan_summary': 'Resumen',
+        'scan_photos': 'Fotos',
+        'scan_videos': 'Vídeos',
+        'scan_total_size': 'Tamaño estimado',
+        'scan_date_range': 'Rango de fechas',
+        'scanning': 'Escaneando…',
+        'table_name': 'Nombre',
+        'table_type': 'Tipo',
+        'table_date': 'Fecha',
+        'table_size': 'Tamaño',
+        'table_path': 'Ruta en dispositivo',
+        'structure_label': 'Estructura',
+        'destination_label': 'Carpeta destino',
+        'preset_a': 'A) Año/Mes',
+        'preset_b': 'B) Año/Mes/Día',
+        'preset_c': 'C) Todo junto (Import_iPhone)',
+        'preset_d': 'D) Por tipo + Año/Mes',
+        'preset_e': 'E) Por semana',
+        'preset_f': 'F) Por dispositivo + Año/Mes',
+        'advanced_toggle': 'Más opciones…',
+        'template_label': 'Plantilla',
+        'template_hint': 'Tokens: {YYYY} {MM} {DD} {WW} {DEVICE} {TYPE}',
+        'preview_label': 'Vista previa (primeras 20)',
+        'compat_checkbox': 'Crear copias compatibles',
+        'compat_help': 'Se conservarán los originales y además se crearán copias JPG/MP4 compatibles.',
+        'compat_missing': 'Faltan herramientas en ./tools. Copia ffmpeg.exe y exiftool.exe a ./tools (opcional).',
+        'live_checkbox': 'Mantener Live Photos juntas',
+        'import_preview': 'Preview final (primeras 20)',
+        'progress_global': 'Progreso global',
+        'progress_file': 'Archivo actual',
+        'log_live': 'Log en vivo',
+        'summary_title': 'Resumen',
+        'summary_copied': 'Copiados',
+        'summary_skipped': 'Saltados',
+        'summary_failed': 'Fallidos',
+        'summary_converted': 'Copias compatibles',
+        'open_destination': 'Abrir destino',
+        'open_log': 'Ver log',
+        'status_ready': 'Listo',
+        'status_importing': 'Importando…',
+        'status_done': 'Terminado',
+        'status_cancelled': 'Cancelado',
+    },
+    'ca': {
+        'app_title': 'iImport',
+        'wizard_subtitle': 'Importa fotos i vídeos des d’iPhone',
+        'step_device': 'Dispositiu',
+        'step_scan': 'Escaneig',
+        'step_options': 'Destí',
+        'step_import': 'Importació',
+        'back': 'Enrere',
+        'next': 'Següent',
+        'cancel': 'Cancel·la',
+        'error_no_iphone': 'No es detecta iPhone.',
+        'error_scan_cancelled': 'Escaneig cancel·lat.',
+        'error_scan_failed': "L'escaneig ha fallat.",
+        'error_import_cancelled': 'Importació cancel·lada.',
+        'error_import_failed': 'La importació ha fallat.',
+        'error_tools_missing': 'Falten eines a ./tools. Copia ffmpeg.exe i exiftool.exe a ./tools (opcional).',
+        'error_conversion_failed': "No s'ha pogut crear la còpia compatible de {name}.",
+        'error_device_disconnected': 'Dispositiu desconnectat.',
+        'close': 'Tanca',
+        'start_import': 'Inicia la importació',
+        'refresh': 'Actualitza',
+        'scan': 'Escaneja dispositiu',
+        'browse': 'Tria…',
+        'device_instructions': 'Desbloqueja l’iPhone i toca “Confia” quan aparegui.',
+        'device_none': 'No es detecta cap iPhone.',
+        'device_select': 'Selecciona un dispositiu',
+        'scan_summary': 'Resum',
+        'scan_photos': 'Fotos',
+        'scan_videos': 'Vídeos',
+        'scan_total_size': 'Mida estimada',
+        'scan_date_range': 'Rang de dates',
+        'scanning': 'Escanejant…',
+        'table_name': 'Nom',
+        'table_type': 'Tipus',
+        'table_date': 'Data',
+        'table_size': 'Mida',
+        'table_path': 'Ruta al dispositiu',
+        'structure_label': 'Estructura',
+        'destination_label': 'Carpeta destí',
+        'preset_a': 'A) Any/Mes',
+        'preset_b': 'B) Any/Mes/Dia',
+        'preset_c': 'C) Tot junt (Import_iPhone)',
+        'preset_d': 'D) Per tipus + Any/Mes',
+        'preset_e': 'E) Per setmana',
+        'preset_f': 'F) Per dispositiu + Any/Mes',
+        'advanced_toggle': 'Més opcions…',
+        'template_label': 'Plantilla',
+        'template_hint': 'Tokens: {YYYY} {MM} {DD} {WW} {DEVICE} {TYPE}',
+        'preview_label': 'Vista prèvia (primeres 20)',
+        'compat_checkbox': 'Crea còpies compatibles',
+        'compat_help': 'Es conserven els originals i es creen còpies JPG/MP4 compatibles.',
+        'compat_missing': 'Falten eines a ./tools. Copia ffmpeg.exe i exiftool.exe a ./tools (opcional).',
+        'live_checkbox': 'Mantén les Live Photos juntes',
+        'import_preview': 'Vista final (primeres 20)',
+        'progress_global': 'Progrés global',
+        'progress_file': 'Fitxer actual',
+        'log_live': 'Log en viu',
+        'summary_title': 'Resum',
+        'summary_copied': 'Copiats',
+        'summary_skipped': 'Saltats',
+        'summary_failed': 'Fallits',
+        'summary_converted': 'Còpies compatibles',
+        'open_destination': 'Obre el destí',
+        'open_log': 'Veure el log',
+        'status_ready': 'A punt',
+        'status_importing': 'Important…',
+        'status_done': 'Fet',
+        'status_cancelled': 'Cancel·lat',
+    },
+}
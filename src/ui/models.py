@@ -1,6 +1,5 @@
 ﻿from __future__ import annotations
 
-from datetime import datetime
 from typing import List
 
 from PySide6 import QtCore
@@ -8,34 +7,71 @@ from PySide6 import QtCore
 from domain import MediaItem
 from ui.translator import format_bytes
 
+_HEADER_KEYS = ('table_name', 'table_type', 'table_date', 'table_size', 'table_path')
+
 
 class MediaTableModel(QtCore.QAbstractTableModel):
     def __init__(self, translator) -> None:
         super().__init__()
         self._items: List[MediaItem] = []
         self._tr = translator
+        # Display strings precomputed per row, one list per column
+        self._columns: List[List[str]] = [[], [], [], [], []]
+        self._tr.language_changed.connect(self._on_language_changed)
+        self._headers: tuple[str, ...] = ()
+        self._translate_headers()
+        # Items received via append_items, inserted in one batch per flush tick
+        self._pending: List[MediaItem] = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
 
     def set_items(self, items: List[MediaItem]) -> None:
+        self._discard_pending()
         self.beginResetModel()
         self._items = items
+        self._columns = [[], [], [], [], []]
+        self._project(items)
         self.endResetModel()
 
     def append_items(self, new_items: List[MediaItem]) -> None:
-        """Append new items to the model for real-time updates."""
+        """Queue new items for real-time updates; they are inserted together on the next flush."""
+        if not new_items:
+            return
+        self._pending.extend(new_items)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_pending(self) -> None:
+        """Insert buffered items now instead of waiting for the timer."""
+        self._flush_timer.stop()
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        new_items = self._pending
         if not new_items:
             return
+        self._pending = []
         first_new = len(self._items)
         last_new = first_new + len(new_items) - 1
         self.beginInsertRows(QtCore.QModelIndex(), first_new, last_new)
         self._items.extend(new_items)
+        self._project(new_items)
         self.endInsertRows()
 
     def clear_items(self) -> None:
         """Clear all items from the model."""
+        self._discard_pending()
         self.beginResetModel()
         self._items = []
+        self._columns = [[], [], [], [], []]
         self.endResetModel()
 
+    def _discard_pending(self) -> None:
+        self._flush_timer.stop()
+        self._pending = []
+
     def get_items(self) -> List[MediaItem]:
         """Get all items currently in the model."""
         return self._items
@@ -49,31 +85,48 @@ class MediaTableModel(QtCore.QAbstractTableModel):
     def headerData(self, section: int, orientation, role=QtCore.Qt.DisplayRole):
         if role != QtCore.Qt.DisplayRole or orientation != QtCore.Qt.Horizontal:
             return None
-        keys = ['table_name', 'table_type', 'table_date', 'table_size', 'table_path']
-        if 0 <= section < len(keys):
-            return self._tr.tr(keys[section])
+        if 0 <= section < len(self._headers):
+            return self._headers[section]
         return None
 
+    def _translate_headers(self) -> None:
+        labels = self._tr.batch(_HEADER_KEYS)
+        self._headers = tuple(labels[key] for key in _HEADER_KEYS)
+
     def data(self, index, role=QtCore.Qt.DisplayRole):
-        if not index.isValid() or not (0 <= index.row() < len(self._items)):
+        # The view asks for many roles per cell; only DisplayRole has data
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
             return None
-        item = self._items[index.row()]
-        if role == QtCore.Qt.DisplayRole:
-            if index.column() == 0:
-                return item.name
-            if index.column() == 1:
-                return self._type_label(item)
-            if index.column() == 2:
-                return item.created.strftime('%Y-%m-%d %H:%M:%S') if item.created else '-'
-            if index.column() == 3:
-                return format_bytes(item.size)
-            if index.column() == 4:
-                return item.device_path
-        return None
+        row = index.row()
+        if not (0 <= row < len(self._items)):
+            return None
+        return self._columns[index.column()][row]
+
+    def _project(self, items: List[MediaItem]) -> None:
+        """Append the display strings of items to the per-column lists."""
+        names, types, dates, sizes, paths = self._columns
+        photo_label = self._tr.tr('scan_photos')
+        video_label = self._tr.tr('scan_videos')
+        for item in items:
+            names.append(item.name)
+            types.append(self._type_label(item, photo_label, video_label))
+            dates.append(item.created.strftime('%Y-%m-%d %H:%M:%S') if item.created else '-')
+            sizes.append(format_bytes(item.size))
+            paths.append(item.device_path)
+
+    def _on_language_changed(self, _code: str) -> None:
+        self._translate_headers()
+        # Only the type column depends on the language
+        photo_label = self._tr.tr('scan_photos')
+        video_label = self._tr.tr('scan_videos')
+        self._columns[1] = [self._type_label(item, photo_label, video_label) for item in self._items]
+        if self._items:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self._items) - 1, 1), [QtCore.Qt.DisplayRole])
 
-    def _type_label(self, item: MediaItem) -> str:
+    @staticmethod
+    def _type_label(item: MediaItem, photo_label: str, video_label: str) -> str:
         if item.is_photo:
-            return self._tr.tr('scan_photos')
+            return photo_label
         if item.is_video:
-            return self._tr.tr('scan_videos')
+            return video_label
         return '—'
\ No newline at end of file
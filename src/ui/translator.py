@@ -1,6 +1,8 @@
 ﻿from __future__ import annotations
 
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
@@ -8,6 +10,17 @@ from PySide6 import QtCore
 
 from infrastructure.fs.path_utils import resource_path
 
+try:
+    import orjson  # Optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# (raw, merged) tables shared by every Translator in the process
+_cached_translations: tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]] | None = None
+_cache_lock = threading.Lock()
+
 
 class Translator(QtCore.QObject):
     language_changed = QtCore.Signal(str)
@@ -15,21 +28,53 @@ class Translator(QtCore.QObject):
     def __init__(self) -> None:
         super().__init__()
         self._translations: Dict[str, Dict[str, str]] = {}
+        # Per-language tables with English filled in as fallback
+        self._merged: Dict[str, Dict[str, str]] = {}
         self._language = 'en'
         self._load_languages()
+        self._active = self._merged['en']
 
     def _load_languages(self) -> None:
+        global _cached_translations
+        with _cache_lock:
+            if _cached_translations is None:
+                _cached_translations = self._build_tables()
+            self._translations, self._merged = _cached_translations
+
+    @classmethod
+    def _build_tables(cls) -> tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]:
+        # Prefer the module generated from the JSON files (scripts/generate_i18n.py)
+        try:
+            from ui.i18n_data import TRANSLATIONS
+        except ImportError:
+            TRANSLATIONS = {}
+        translations: Dict[str, Dict[str, str]] = {}
         for code in ('en', 'es', 'ca'):
-            path = resource_path(
-                f'ui/i18n/{code}.json',
-                f'src/ui/i18n/{code}.json',
-                f'i18n/{code}.json',
-            )
-            try:
-                data = json.loads(path.read_text(encoding='utf-8-sig'))
-            except Exception:
-                data = {}
-            self._translations[code] = data
+            data = TRANSLATIONS.get(code)
+            if data is None:
+                data = cls._load_json(code)
+            translations[code] = data
+        english = translations['en']
+        merged: Dict[str, Dict[str, str]] = {}
+        for code, data in translations.items():
+            # Empty strings fall back to English
+            merged[code] = {**english, **{k: v for k, v in data.items() if v}}
+        return translations, merged
+
+    @staticmethod
+    def _load_json(code: str) -> Dict[str, str]:
+        path = resource_path(
+            f'ui/i18n/{code}.json',
+            f'src/ui/i18n/{code}.json',
+            f'i18n/{code}.json',
+        )
+        try:
+            raw = path.read_bytes()
+            if raw.startswith(_UTF8_BOM):
+                raw = raw[len(_UTF8_BOM):]
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except Exception:
+            return {}
 
     def set_language(self, code: str) -> None:
         if code not in self._translations:
@@ -37,17 +82,18 @@ class Translator(QtCore.QObject):
         if self._language == code:
             return
         self._language = code
+        self._active = self._merged[code]
         self.language_changed.emit(code)
 
     def language(self) -> str:
         return self._language
 
     def tr(self, key: str) -> str:
-        return (
-            self._translations.get(self._language, {}).get(key)
-            or self._translations.get('en', {}).get(key)
-            or key
-        )
+        return self._active.get(key) or key
+
+    def batch(self, keys) -> Dict[str, str]:
+        """Translate several keys at once, for caching by callers."""
+        return {key: self.tr(key) for key in keys}
 
 
 def detect_system_language() -> str:
@@ -59,6 +105,7 @@ def detect_system_language() -> str:
     return 'en'
 
 
+@lru_cache(maxsize=4096)
 def format_bytes(num: int) -> str:
     if num < 0:
         return '—'  # Unknown size
@@ -12,6 +12,7 @@ class StepIndicator(QtWidgets.QWidget):
         super().__init__()
         self._tr = translator
         self._labels: list[QtWidgets.QLabel] = []
+        self._current = -1
         self._stretch_added = False
         self._layout = QtWidgets.QHBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -29,6 +30,7 @@ class StepIndicator(QtWidgets.QWidget):
             self._layout.removeWidget(label)
             label.deleteLater()
         self._labels = []
+        self._current = -1
         for idx, title in enumerate(titles, start=1):
             label = QtWidgets.QLabel(f'{idx}. {title}')
             label.setProperty('stepActive', False)
@@ -40,10 +42,17 @@ class StepIndicator(QtWidgets.QWidget):
             self._stretch_added = True
 
     def set_current(self, index: int) -> None:
-        for idx, label in enumerate(self._labels):
-            label.setProperty('stepActive', idx == index)
-            label.style().unpolish(label)
-            label.style().polish(label)
+        if index == self._current:
+            return
+        # Only the previously active label and the new one change state
+        for idx in (self._current, index):
+            if 0 <= idx < len(self._labels):
+                label = self._labels[idx]
+                label.setUpdatesEnabled(False)
+                label.setProperty('stepActive', idx == index)
+                label.style().polish(label)
+                label.setUpdatesEnabled(True)
+        self._current = index
 
 
 class DevicePage(QtWidgets.QWidget):
@@ -54,6 +63,7 @@ class DevicePage(QtWidgets.QWidget):
         super().__init__()
         self._tr = translator
         self._devices: list[DeviceInfo] = []
+        self._placeholder: QtWidgets.QListWidgetItem | None = None
 
         self.title = QtWidgets.QLabel()
         self.title.setObjectName('PageTitle')
@@ -66,7 +76,7 @@ class DevicePage(QtWidgets.QWidget):
         self.list.itemSelectionChanged.connect(self._emit_selection)
 
         self.refresh_btn = QtWidgets.QPushButton()
-        self.refresh_btn.clicked.connect(self.refresh_requested.emit)
+        self.refresh_btn.clicked.connect(self.refresh_requested)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setSpacing(12)
@@ -79,14 +89,19 @@ class DevicePage(QtWidgets.QWidget):
         self.title.setText(self._tr.tr('step_device'))
         self.instructions.setText(self._tr.tr('device_instructions'))
         self.refresh_btn.setText(self._tr.tr('refresh'))
+        # Only the placeholder row carries translated text; device rows stay as-is
+        if self._placeholder is not None:
+            self._placeholder.setText(self._tr.tr('error_no_iphone'))
 
     def set_devices(self, devices: list[DeviceInfo]) -> None:
         self._devices = devices
         self.list.clear()
+        self._placeholder = None
         if not devices:
             item = QtWidgets.QListWidgetItem(self._tr.tr('error_no_iphone'))
             item.setFlags(QtCore.Qt.NoItemFlags)
             self.list.addItem(item)
+            self._placeholder = item
             return
         for device in devices:
             text = device.name
@@ -104,6 +119,7 @@ class DevicePage(QtWidgets.QWidget):
             return None
         return items[0].data(QtCore.Qt.UserRole)
 
+    @QtCore.Slot()
     def _emit_selection(self) -> None:
         device = self.selected_device()
         if device:
@@ -113,21 +129,28 @@ class DevicePage(QtWidgets.QWidget):
 class ScanPage(QtWidgets.QWidget):
     scan_requested = QtCore.Signal()
     cancel_requested = QtCore.Signal()
+    # Strings used on every progress tick, refreshed in retranslate
+    _HOT_KEYS = ('scan_photos', 'scan_videos')
 
     def __init__(self, translator) -> None:
         super().__init__()
         self._tr = translator
+        self._t = translator.batch(self._HOT_KEYS)
         self._model = MediaTableModel(translator)
         self._result: ScanResult | None = None
+        self._last_items: list | None = None
+        # Running counts of items received during a scan
+        self._live_photos = 0
+        self._live_videos = 0
         self._current_total = 0
 
         self.title = QtWidgets.QLabel()
         self.title.setObjectName('PageTitle')
 
         self.scan_btn = QtWidgets.QPushButton()
-        self.scan_btn.clicked.connect(self.scan_requested.emit)
+        self.scan_btn.clicked.connect(self.scan_requested)
         self.cancel_btn = QtWidgets.QPushButton()
-        self.cancel_btn.clicked.connect(self.cancel_requested.emit)
+        self.cancel_btn.clicked.connect(self.cancel_requested)
         self.cancel_btn.setVisible(False)
         self.cancel_btn.setEnabled(False)
         self.progress = QtWidgets.QProgressBar()
@@ -153,7 +176,10 @@ class ScanPage(QtWidgets.QWidget):
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
-        self.table.setAlternatingRowColors(True)
+        # Striping at 2% alpha was barely visible but cost a background pass per row
+        self.table.setAlternatingRowColors(False)
+        # Rows arrive in batches from the model; keep the newest ones visible
+        self._model.rowsInserted.connect(self._on_rows_inserted)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setSpacing(12)
@@ -168,17 +194,15 @@ class ScanPage(QtWidgets.QWidget):
         layout.addWidget(self.table, 1)
 
     def retranslate(self) -> None:
+        self._t = self._tr.batch(self._HOT_KEYS)
         self.title.setText(self._tr.tr('step_scan'))
         self.scan_btn.setText(self._tr.tr('scan'))
         self.cancel_btn.setText(self._tr.tr('cancel'))
         self.summary_group.setTitle(self._tr.tr('scan_summary'))
         self._model.headerDataChanged.emit(QtCore.Qt.Horizontal, 0, 4)
+        # The model refreshes its language-dependent type column by itself
         if self._result:
-            self.set_scan_result(self._result)
-        if self._model.rowCount() > 0:
-            top_left = self._model.index(0, 0)
-            bottom_right = self._model.index(self._model.rowCount() - 1, self._model.columnCount() - 1)
-            self._model.dataChanged.emit(top_left, bottom_right)
+            self._update_labels(self._result)
 
     def set_scanning(self, scanning: bool) -> None:
         self._current_total = 0
@@ -186,6 +210,9 @@ class ScanPage(QtWidgets.QWidget):
         self.cancel_btn.setEnabled(scanning)
         if scanning:
             self._model.clear_items()  # Clear previous results
+            self._last_items = None
+            self._live_photos = 0
+            self._live_videos = 0
             self.progress.setRange(0, 0)
             self.progress.setFormat(self._tr.tr('scan'))
             # Clear summary while scanning
@@ -203,10 +230,11 @@ class ScanPage(QtWidgets.QWidget):
         self.progress.setValue(0)
         self.progress.setFormat(self._tr.tr('error_scan_cancelled'))
 
+    @QtCore.Slot(int, int, str)
     def set_scan_progress(self, done: int, total: int, path: str) -> None:
         # done = media found, total = folders scanned
         # Update progress bar text with current status
-        media_count = self._model.rowCount()
+        media_count = self._live_photos + self._live_videos
         label = f'📷 {media_count}'
         if total > 0:
             label = f'{label} | 📁 {total}'
@@ -217,29 +245,55 @@ class ScanPage(QtWidgets.QWidget):
         self.progress.setFormat(label)
         
         # Update live counts in summary
-        items = self._model.get_items()
-        photos = sum(1 for i in items if i.is_photo)
-        videos = sum(1 for i in items if i.is_video)
-        self.lbl_photos.setText(f"{self._tr.tr('scan_photos')}: {photos}")
-        self.lbl_videos.setText(f"{self._tr.tr('scan_videos')}: {videos}")
+        self.lbl_photos.setText(f"{self._t['scan_photos']}: {self._live_photos}")
+        self.lbl_videos.setText(f"{self._t['scan_videos']}: {self._live_videos}")
 
+    @QtCore.Slot(list)
     def add_scan_items(self, new_items: list) -> None:
         """Add newly found items to the table in real-time."""
         self._model.append_items(new_items)
+        for item in new_items:
+            if item.is_photo:
+                self._live_photos += 1
+            elif item.is_video:
+                self._live_videos += 1
+
+    @QtCore.Slot(QtCore.QModelIndex, int, int)
+    def _on_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
         # Scroll to bottom to show newest items
-        if new_items:
-            self.table.scrollToBottom()
+        self.table.scrollToBottom()
 
     def set_scan_result(self, result: ScanResult | None) -> None:
         self._result = result
+        self._set_items(result)
+        self._update_labels(result)
+
+    def _set_items(self, result: ScanResult | None) -> None:
         if not result:
+            self._last_items = None
             self._model.set_items([])
+            return
+        # Resetting the model is the expensive part; skip it for the same list
+        if result.items is self._last_items:
+            return
+        self._last_items = result.items
+        # Rows streamed in during the scan already match the final result, unless the
+        # scan fell back to another backend: same count, different objects
+        self._model.flush_pending()
+        shown = self._model.get_items()
+        if result.items and len(shown) == len(result.items) and all(
+            a.object_id == b.object_id for a, b in zip(shown, result.items)
+        ):
+            return
+        self._model.set_items(result.items)
+
+    def _update_labels(self, result: ScanResult | None) -> None:
+        if not result:
             self.lbl_photos.setText('')
             self.lbl_videos.setText('')
             self.lbl_size.setText('')
             self.lbl_dates.setText('')
             return
-        self._model.set_items(result.items)
         self.lbl_photos.setText(f"{self._tr.tr('scan_photos')}: {result.total_photos}")
         self.lbl_videos.setText(f"{self._tr.tr('scan_videos')}: {result.total_videos}")
         self.lbl_size.setText(f"{self._tr.tr('scan_total_size')}: {format_bytes(result.total_size)}")
@@ -260,8 +314,8 @@ class OptionsPage(QtWidgets.QWidget):
         self.dest_label = QtWidgets.QLabel()
         self.dest_edit = QtWidgets.QLineEdit()
         self.dest_btn = QtWidgets.QPushButton()
-        self.dest_btn.clicked.connect(self.browse_requested.emit)
-        self.dest_edit.textChanged.connect(self._emit_options_changed)
+        self.dest_btn.clicked.connect(self.browse_requested)
+        self.dest_edit.textChanged.connect(self.options_changed)
 
         dest_row = QtWidgets.QHBoxLayout()
         dest_row.addWidget(self.dest_edit, 1)
@@ -269,7 +323,11 @@ class OptionsPage(QtWidgets.QWidget):
 
         self.structure_label = QtWidgets.QLabel()
         self.preset_combo = QtWidgets.QComboBox()
-        self.preset_combo.currentIndexChanged.connect(self._emit_options_changed)
+        # Items are created once; retranslate only relabels them
+        for code in ('A', 'B', 'C', 'D', 'E', 'F'):
+            self.preset_combo.addItem(code, code)
+        self.preset_index = {self.preset_combo.itemData(i): i for i in range(self.preset_combo.count())}
+        self.preset_combo.currentIndexChanged.connect(self.options_changed)
 
         self.advanced_toggle = QtWidgets.QPushButton()
         self.advanced_toggle.setCheckable(True)
@@ -282,14 +340,20 @@ class OptionsPage(QtWidgets.QWidget):
         self.template_edit = QtWidgets.QLineEdit()
         self.template_hint = QtWidgets.QLabel()
         self.template_hint.setObjectName('HintLabel')
-        self.template_edit.textChanged.connect(self._emit_options_changed)
+        self.template_edit.textChanged.connect(self.options_changed)
         adv_layout.addWidget(self.template_label)
         adv_layout.addWidget(self.template_edit)
         adv_layout.addWidget(self.template_hint)
         self.advanced_widget.setVisible(False)
 
         self.preview_label = QtWidgets.QLabel()
-        self.preview_list = QtWidgets.QListWidget()
+        self._preview_model = QtCore.QStringListModel(self)
+        self.preview_list = QtWidgets.QListView()
+        self.preview_list.setModel(self._preview_model)
+        self.preview_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.preview_list.setUniformItemSizes(True)
+        self.preview_list.setLayoutMode(QtWidgets.QListView.Batched)
+        self.preview_list.setBatchSize(200)
         self.preview_list.setMinimumHeight(140)
 
         self.compat_checkbox = QtWidgets.QCheckBox()
@@ -302,8 +366,8 @@ class OptionsPage(QtWidgets.QWidget):
 
         self.live_checkbox = QtWidgets.QCheckBox()
 
-        self.compat_checkbox.toggled.connect(self._emit_options_changed)
-        self.live_checkbox.toggled.connect(self._emit_options_changed)
+        self.compat_checkbox.toggled.connect(self.options_changed)
+        self.live_checkbox.toggled.connect(self.options_changed)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setSpacing(12)
@@ -338,29 +402,14 @@ class OptionsPage(QtWidgets.QWidget):
         self.live_checkbox.setText(self._tr.tr('live_checkbox'))
 
     def _load_presets(self) -> None:
-        current = self.preset_combo.currentData()
-        self.preset_combo.blockSignals(True)
-        self.preset_combo.clear()
-        self.preset_combo.addItem(self._tr.tr('preset_a'), 'A')
-        self.preset_combo.addItem(self._tr.tr('preset_b'), 'B')
-        self.preset_combo.addItem(self._tr.tr('preset_c'), 'C')
-        self.preset_combo.addItem(self._tr.tr('preset_d'), 'D')
-        self.preset_combo.addItem(self._tr.tr('preset_e'), 'E')
-        self.preset_combo.addItem(self._tr.tr('preset_f'), 'F')
-        if current:
-            idx = self.preset_combo.findData(current)
-            if idx >= 0:
-                self.preset_combo.setCurrentIndex(idx)
-        self.preset_combo.blockSignals(False)
+        for code, idx in self.preset_index.items():
+            self.preset_combo.setItemText(idx, self._tr.tr(f'preset_{code.lower()}'))
 
+    @QtCore.Slot(bool)
     def _toggle_advanced(self, checked: bool) -> None:
         self.advanced_widget.setVisible(checked)
         self.options_changed.emit()
 
-    def _emit_options_changed(self, *args) -> None:
-        """Wrapper to emit options_changed ignoring signal arguments."""
-        self.options_changed.emit()
-
     def set_destination(self, path: str) -> None:
         self.dest_edit.setText(path)
 
@@ -377,9 +426,9 @@ class OptionsPage(QtWidgets.QWidget):
         return self.advanced_widget.isVisible() and self.advanced_toggle.isChecked()
 
     def set_preview(self, paths: list[str]) -> None:
-        self.preview_list.clear()
-        for path in paths:
-            self.preview_list.addItem(path)
+        self.preview_list.setUpdatesEnabled(False)
+        self._preview_model.setStringList(paths)
+        self.preview_list.setUpdatesEnabled(True)
 
     def set_conversion_available(self, available: bool) -> None:
         self.compat_checkbox.setEnabled(available)
@@ -389,23 +438,32 @@ class OptionsPage(QtWidgets.QWidget):
 class ImportPage(QtWidgets.QWidget):
     start_requested = QtCore.Signal()
     cancel_requested = QtCore.Signal()
+    # Strings used on every progress tick, refreshed in retranslate
+    _HOT_KEYS = ('progress_file', 'progress_global')
 
     def __init__(self, translator) -> None:
         super().__init__()
         self._tr = translator
+        self._t = translator.batch(self._HOT_KEYS)
         self._result = None
 
         self.title = QtWidgets.QLabel()
         self.title.setObjectName('PageTitle')
 
         self.preview_label = QtWidgets.QLabel()
-        self.preview_list = QtWidgets.QListWidget()
+        self._preview_model = QtCore.QStringListModel(self)
+        self.preview_list = QtWidgets.QListView()
+        self.preview_list.setModel(self._preview_model)
+        self.preview_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.preview_list.setUniformItemSizes(True)
+        self.preview_list.setLayoutMode(QtWidgets.QListView.Batched)
+        self.preview_list.setBatchSize(200)
         self.preview_list.setMinimumHeight(140)
 
         self.start_btn = QtWidgets.QPushButton()
-        self.start_btn.clicked.connect(self.start_requested.emit)
+        self.start_btn.clicked.connect(self.start_requested)
         self.cancel_btn = QtWidgets.QPushButton()
-        self.cancel_btn.clicked.connect(self.cancel_requested.emit)
+        self.cancel_btn.clicked.connect(self.cancel_requested)
         self.cancel_btn.setEnabled(False)
 
         btn_row = QtWidgets.QHBoxLayout()
@@ -422,6 +480,15 @@ class ImportPage(QtWidgets.QWidget):
         self.log_text = QtWidgets.QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumBlockCount(500)
+        self.log_text.setWordWrapMode(QtGui.QTextOption.NoWrap)
+        self.log_text.setCenterOnScroll(False)
+        self.log_text.setUndoRedoEnabled(False)
+        # Log lines are buffered and appended in one block per flush tick
+        self._log_buf: list[str] = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(75)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self.summary_group = QtWidgets.QGroupBox()
         summary_layout = QtWidgets.QGridLayout(self.summary_group)
@@ -462,6 +529,7 @@ class ImportPage(QtWidgets.QWidget):
         self.summary_group.setVisible(False)
 
     def retranslate(self) -> None:
+        self._t = self._tr.batch(self._HOT_KEYS)
         self.title.setText(self._tr.tr('step_import'))
         self.preview_label.setText(self._tr.tr('import_preview'))
         self.start_btn.setText(self._tr.tr('start_import'))
@@ -476,20 +544,33 @@ class ImportPage(QtWidgets.QWidget):
             self.set_result(self._result)
 
     def set_plan(self, plan: ImportPlan | None) -> None:
-        self.preview_list.clear()
-        if not plan:
-            return
-        for path in plan.preview_paths:
-            self.preview_list.addItem(path)
+        self.preview_list.setUpdatesEnabled(False)
+        self._preview_model.setStringList(plan.preview_paths if plan else [])
+        self.preview_list.setUpdatesEnabled(True)
 
     def set_running(self, running: bool) -> None:
         self.start_btn.setEnabled(not running)
         self.cancel_btn.setEnabled(running)
 
+    @QtCore.Slot(str)
     def append_log(self, line: str) -> None:
-        self.log_text.appendPlainText(line)
+        self._log_buf.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @QtCore.Slot()
+    def _flush_log(self) -> None:
+        if not self._log_buf:
+            return
+        # The widget keeps only the last 500 blocks anyway
+        lines = self._log_buf[-500:]
+        self._log_buf = []
+        # appendPlainText keeps following the tail only when the view was already there
+        self.log_text.appendPlainText('\n'.join(lines))
 
     def reset_log(self) -> None:
+        self._log_timer.stop()
+        self._log_buf = []
         self.log_text.clear()
 
     def reset_progress(self) -> None:
@@ -498,28 +579,35 @@ class ImportPage(QtWidgets.QWidget):
         self.progress_file.setMaximum(1)
         self.progress_file.setValue(0)
 
+    @staticmethod
+    def _set_bar(bar: QtWidgets.QProgressBar, value: int, maximum: int) -> None:
+        # setMaximum re-emits rangeChanged and relayouts even when unchanged
+        if bar.maximum() != maximum:
+            bar.setMaximum(maximum)
+        bar.setValue(value)
+
+    @QtCore.Slot(object)
     def set_progress(self, progress) -> None:
+        # TransferWorker already limits these to ~30 per second
         scale = 1
         if progress.bytes_total > 2_000_000_000:
             scale = 1024 * 1024
         if progress.bytes_total > 0:
-            self.progress_global.setMaximum(int(progress.bytes_total / scale))
-            self.progress_global.setValue(int(progress.bytes_done / scale))
+            self._set_bar(self.progress_global, int(progress.bytes_done / scale), int(progress.bytes_total / scale))
         elif progress.total_files > 0:
-            self.progress_global.setMaximum(progress.total_files)
-            self.progress_global.setValue(progress.current_index)
+            self._set_bar(self.progress_global, progress.current_index, progress.total_files)
         if progress.current_total > 0:
-            self.progress_file.setMaximum(int(progress.current_total / scale))
-            self.progress_file.setValue(int(progress.current_bytes / scale))
+            self._set_bar(self.progress_file, int(progress.current_bytes / scale), int(progress.current_total / scale))
         if progress.current_file:
-            self.file_label.setText(f"{self._tr.tr('progress_file')}: {progress.current_file}")
+            self.file_label.setText(f"{self._t['progress_file']}: {progress.current_file}")
 
         if progress.total_files > 0:
             percent = int(100 * progress.current_index / progress.total_files)
             self.progress_label.setText(
-                f"{self._tr.tr('progress_global')}: {percent}%  ({progress.current_index}/{progress.total_files})"
+                f"{self._t['progress_global']}: {percent}%  ({progress.current_index}/{progress.total_files})"
             )
 
+    @QtCore.Slot(object)
     def set_result(self, result) -> None:
         self._result = result
         self.summary_copied.setText(f"{self._tr.tr('summary_copied')}: {result.copied}")
@@ -2,45 +2,121 @@
 
 from PySide6 import QtCore
 
+from application.detect_devices import detect_iphone_devices
 from application.scan_device import scan_device
 from application.execute_transfer import execute_transfer
-from domain import CancelToken, DeviceInfo, ImportOptions, ImportPlan
+from domain import CancelToken, DeviceInfo, ImportOptions, ImportPlan, TransferProgress
 from domain.errors import ScanCancelled
 
 
-class ScanWorker(QtCore.QThread):
+class PooledWorker(QtCore.QObject, QtCore.QRunnable):
+    """Signal-carrying job run on the global QThreadPool instead of a thread of its own."""
+
+    def __init__(self) -> None:
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        # The window holds the reference until the job's final signal arrives
+        self.setAutoDelete(False)
+
+    def start(self) -> None:
+        QtCore.QThreadPool.globalInstance().start(self)
+
+
+class DeviceDetectWorker(PooledWorker):
+    detected = QtCore.Signal(list)
+
+    def run(self) -> None:
+        try:
+            devices = detect_iphone_devices()
+        except Exception:
+            # COM error or other WPD issue - show empty list
+            devices = []
+        self.detected.emit(devices)
+
+
+class ScanWorker(PooledWorker):
     finished = QtCore.Signal(object)
     cancelled = QtCore.Signal()
     error = QtCore.Signal(str)
     progress = QtCore.Signal(int, int, str)  # done, total, path
     items_found = QtCore.Signal(list)  # Partial list of new items found
 
+    # Coalesce callbacks so the GUI thread gets at most ~30 updates per second
+    EMIT_INTERVAL_MS = 33
+    MAX_BUFFERED_ITEMS = 128
+
     def __init__(self, device: DeviceInfo, cancel_token: CancelToken) -> None:
         super().__init__()
         self._device = device
         self._cancel_token = cancel_token
+        self._timer = QtCore.QElapsedTimer()
+        self._last_progress_emit = 0
+        self._last_items_emit = 0
+        self._item_buf: list = []
+        self._last_progress: tuple[int, int, str] | None = None
+
+    def _on_progress(self, done: int, total: int, path: str) -> None:
+        self._last_progress = (done, total, path)
+        now = self._timer.elapsed()
+        # Folders without media bring no item callbacks; don't let buffered rows wait for one
+        if self._item_buf and now - self._last_items_emit >= self.EMIT_INTERVAL_MS:
+            self._last_items_emit = now
+            self._flush_items()
+        if now - self._last_progress_emit >= self.EMIT_INTERVAL_MS:
+            self._last_progress_emit = now
+            self._last_progress = None
+            self.progress.emit(done, total, path)
+
+    def _on_items(self, items: list) -> None:
+        self._item_buf.extend(items)
+        now = self._timer.elapsed()
+        if (
+            len(self._item_buf) >= self.MAX_BUFFERED_ITEMS
+            or now - self._last_items_emit >= self.EMIT_INTERVAL_MS
+        ):
+            self._last_items_emit = now
+            self._flush_items()
+
+    def _flush_items(self) -> None:
+        if self._item_buf:
+            batch, self._item_buf = self._item_buf, []
+            self.items_found.emit(batch)
+
+    def _flush(self) -> None:
+        self._flush_items()
+        if self._last_progress is not None:
+            self.progress.emit(*self._last_progress)
+            self._last_progress = None
 
     def run(self) -> None:
+        self._timer.start()
         try:
             result = scan_device(
                 self._device,
-                progress_cb=self.progress.emit,
-                items_cb=self.items_found.emit,
+                progress_cb=self._on_progress,
+                items_cb=self._on_items,
                 cancel_token=self._cancel_token,
             )
+            self._flush()
             self.finished.emit(result)
         except ScanCancelled:
+            self._flush()
             self.cancelled.emit()
         except Exception as exc:
+            self._flush()
             self.error.emit(str(exc))
 
 
-class TransferWorker(QtCore.QThread):
+class TransferWorker(PooledWorker):
+    # TransferProgress; byte counters can exceed a 32-bit Qt int, so it travels as object
     progress = QtCore.Signal(object)
     log = QtCore.Signal(str)
     finished = QtCore.Signal(object)
     error = QtCore.Signal(str)
 
+    # The only progress gate between execute_transfer and ImportPage (~30 updates per second)
+    PROGRESS_INTERVAL_MS = 33
+
     def __init__(
         self,
         plan: ImportPlan,
@@ -53,17 +129,43 @@ class TransferWorker(QtCore.QThread):
         self._device = device
         self._options = options
         self._cancel_token = cancel_token
+        self._timer = QtCore.QElapsedTimer()
+        self._last_emit = -1000
+        self._pending: TransferProgress | None = None
+
+    def _on_progress(self, progress: TransferProgress) -> None:
+        # Hold back ticks closer than PROGRESS_INTERVAL_MS apart, except the last one
+        now = self._timer.elapsed()
+        is_final = (
+            progress.current_index >= progress.total_files
+            and progress.current_bytes >= progress.current_total
+        )
+        if not is_final and now - self._last_emit < self.PROGRESS_INTERVAL_MS:
+            self._pending = progress
+            return
+        self._last_emit = now
+        self._pending = None
+        self.progress.emit(progress)
+
+    def _flush_progress(self) -> None:
+        # A run that stops early (cancel, disconnect) never sends a final tick
+        if self._pending is not None:
+            self.progress.emit(self._pending)
+            self._pending = None
 
     def run(self) -> None:
+        self._timer.start()
         try:
             result = execute_transfer(
                 self._plan,
                 self._device,
                 self._options,
-                self.progress.emit,
+                self._on_progress,
                 self.log.emit,
                 self._cancel_token,
             )
+            self._flush_progress()
             self.finished.emit(result)
         except Exception as exc:
+            self._flush_progress()
             self.error.emit(str(exc))
@@ -0,0 +1,45 @@
+﻿import pytest
+
+from infrastructure.fs import config_store
+from infrastructure.fs.config_store import DEFAULT_CONFIG, fast_dumps, fast_loads, load_config, save_config
+
+
+def _sample() -> dict:
+    return {
+        'language': 'es',
+        'structure_preset': 'B',
+        'template': '{YYYY}/{MM}/{DD}/',
+        'last_destination': 'D:/Fotos/Cámara',
+        'keep_live': False,
+        'create_compat': True,
+    }
+
+
+def test_round_trip_with_orjson():
+    if config_store.orjson is None:
+        pytest.skip('orjson not installed')
+    data = _sample()
+    assert fast_loads(fast_dumps(data)) == data
+
+
+def test_round_trip_without_orjson(monkeypatch):
+    monkeypatch.setattr(config_store, 'orjson', None)
+    data = _sample()
+    raw = fast_dumps(data)
+    assert isinstance(raw, bytes)
+    assert fast_loads(raw) == data
+
+
+def test_save_then_load(tmp_path):
+    data = _sample()
+    data['unknown_key'] = 1
+    save_config(tmp_path, data)
+    cfg = load_config(tmp_path)
+    assert cfg == {k: data[k] for k in DEFAULT_CONFIG}
+    assert not (tmp_path / 'config.json.tmp').exists()
+
+
+def test_load_missing_or_corrupt_returns_defaults(tmp_path):
+    assert load_config(tmp_path) == DEFAULT_CONFIG
+    (tmp_path / 'config.json').write_bytes(b'{not json')
+    assert load_config(tmp_path) == DEFAULT_CONFIG
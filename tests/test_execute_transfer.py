@@ -0,0 +1,60 @@
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+
+from domain import CancelToken, DeviceInfo, ImportOptions, ImportPlan, MediaItem, PlanItem
+from application import execute_transfer as transfer
+from application.core_messages import tr
+
+
+def _plan(dest: Path, count: int) -> ImportPlan:
+    items = []
+    for i in range(count):
+        name = f'IMG_{i:04d}.JPG'
+        media = MediaItem(
+            device_id='dev',
+            object_id=f'::{{shell}}\\DCIM\\{name}',
+            name=name,
+            extension='.JPG',
+            size=4,
+            created=datetime(2024, 5, 10),
+            device_path=f'DCIM/{name}',
+            content_type='',
+        )
+        rel = f'2024/05/{name}'
+        items.append(PlanItem(item=media, dest_rel_path=rel, dest_abs_path=dest / rel, temp_abs_path=dest / rel))
+    return ImportPlan(items=items, preview_paths=[], total_files=count, total_size=4 * count)
+
+
+def test_cancel_mid_shell_batch_keeps_finished_copies(tmp_path, monkeypatch):
+    token = CancelToken()
+
+    def fake_batch(pairs, cancel_token, copied_cb=None):
+        # Two copies land, then the user cancels and the rest are never copied
+        for k, (_, temp_path) in enumerate(pairs[:2]):
+            temp_path.write_bytes(b'data')
+            copied_cb(k)
+        cancel_token.cancel()
+        return [True, True] + [False] * (len(pairs) - 2)
+
+    monkeypatch.setattr(transfer, 'download_files_shell_batch', fake_batch)
+    monkeypatch.setattr(transfer, 'open_device_session', lambda device_id: nullcontext())
+    monkeypatch.setattr(transfer, 'conversion_available', lambda app_root: False)
+
+    options = ImportOptions(
+        destination=tmp_path,
+        structure_preset='A',
+        template='{YYYY}/{MM}/',
+        keep_live=True,
+        create_compat=False,
+        language='en',
+    )
+    plan = _plan(tmp_path, 5)
+    lines = []
+    result = transfer.execute_transfer(plan, DeviceInfo(id='1', name='iPhone'), options, None, lines.append, token)
+
+    assert result.cancelled
+    assert (result.copied, result.skipped, result.failed) == (2, 0, 0)
+    assert [p.dest_abs_path.exists() for p in plan.items] == [True, True, False, False, False]
+    assert not list(tmp_path.rglob('*.part'))
+    assert lines.count(tr('en', 'error_import_cancelled')) == 1
@@ -0,0 +1,14 @@
+import json
+from pathlib import Path
+
+from ui.i18n_data import TRANSLATIONS
+
+I18N_DIR = Path(__file__).resolve().parents[1] / 'src' / 'ui' / 'i18n'
+
+
+def test_generated_translations_match_json():
+    codes = sorted(p.stem for p in I18N_DIR.glob('*.json'))
+    assert sorted(TRANSLATIONS) == codes
+    for code in codes:
+        data = json.loads((I18N_DIR / f'{code}.json').read_text(encoding='utf-8-sig'))
+        assert TRANSLATIONS[code] == data